@@ -11,9 +11,9 @@ from typing import Dict, List, Any
 import random  # Added for weather simulation
 
 from llm_toolbridge.core.bridge import ToolBridge
-from src.llm_toolbridge.providers.gemini import GeminiProvider, GeminiConfig
-from src.llm_toolbridge.adapters.gemini import GeminiAdapter
-from src.llm_toolbridge.core.tool import Tool, ParameterDefinition
+from llm_toolbridge.providers.gemini import GeminiProvider, GeminiConfig
+from llm_toolbridge.adapters.gemini import GeminiAdapter
+from llm_toolbridge.core.tool import Tool, ParameterDefinition
 from llm_toolbridge.utils.env_loader import load_dotenv, get_env_var
 
 # Define a simple calculator tool
@@ -14,9 +14,13 @@ setup(
         "requests>=2.25.0",
     ],
     extras_require={
+        "speedups": [
+            "orjson>=3.8.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "isort>=5.0.0",
             "mypy>=1.0.0",
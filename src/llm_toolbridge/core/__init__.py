@@ -7,6 +7,7 @@ tools across different LLM providers.
 
 from .bridge import ToolBridge
 from .provider import Provider, ProviderConfig, ToolCall, LLMResponse
+from .session import ChatSession
 from .tool import Tool, ParameterDefinition
 
 __all__ = [
@@ -15,6 +16,7 @@ __all__ = [
     "ProviderConfig",
     "ToolCall",
     "LLMResponse",
+    "ChatSession",
     "Tool",
     "ParameterDefinition",
 ]
@@ -108,15 +108,28 @@ class AdapterRegistry:
         """
         try:
             # Import the provider module
-            module_path = f"src.providers.{provider_name}"
+            module_path = f"llm_toolbridge.providers.{provider_name}"
             module = importlib.import_module(module_path)
 
-            # Get the provider class (assuming consistent naming convention)
+            # Get the provider class (assuming consistent naming convention).
+            # Reason: matched case-insensitively so that acronyms such as
+            # "AzureOpenAIProvider" resolve from "azure_openai"
             provider_class_name = (
                 "".join(word.capitalize() for word in provider_name.split("_"))
                 + "Provider"
             )
-            provider_class = getattr(module, provider_class_name)
+            provider_class = next(
+                (
+                    getattr(module, name)
+                    for name in dir(module)
+                    if name.lower() == provider_class_name.lower()
+                ),
+                None,
+            )
+            if provider_class is None:
+                raise AttributeError(
+                    f"module '{module_path}' has no attribute '{provider_class_name}'"
+                )
 
             # Create provider instance
             provider = provider_class(config)
@@ -7,6 +7,8 @@ interface for interacting with LLM providers and tools.
 
 from typing import Any, Callable, Dict, List, Optional, Union, Type
 import asyncio
+import threading
+import weakref
 
 from .provider import Provider, LLMResponse, ToolCall
 from .adapter import BaseProviderAdapter
@@ -31,6 +33,9 @@ class ToolBridge:
         self.provider_or_adapter = provider_or_adapter
         self.tools: Dict[str, Tool] = {}
 
+        # Event loops used by execute_sync, one per calling thread
+        self._sync_loops = threading.local()
+
     def register_tool(self, tool: Tool) -> None:
         """
         Register a tool with the ToolBridge.
@@ -225,5 +230,26 @@ class ToolBridge:
             return self.provider_or_adapter.execute_with_tools(
                 prompt, resolved_tools, max_tool_calls, **kwargs
             )
-        # Otherwise, use the async method with asyncio.run
-        return asyncio.run(self.execute(prompt, tools, max_tool_calls, **kwargs))
+        # Otherwise, run the async method on this thread's event loop
+        return self._get_sync_loop().run_until_complete(
+            self.execute(prompt, tools, max_tool_calls, **kwargs)
+        )
+
+    def _get_sync_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Get the event loop execute_sync uses on the calling thread.
+
+        Returns:
+            An event loop that is reused by every execute_sync call made from
+            this thread, and closed when the ToolBridge is garbage collected.
+        """
+        # Reason: providers bind their async clients, and the connection pools
+        # behind them, to the loop they were created on, so a new loop per
+        # call (asyncio.run) would mean a new client and connection every time
+        loop = getattr(self._sync_loops, "loop", None)
+        if loop is None or loop.is_closed():
+            loop = asyncio.new_event_loop()
+            self._sync_loops.loop = loop
+            weakref.finalize(self, loop.close)
+
+        return loop
@@ -0,0 +1,116 @@
+"""
+Chat session module.
+
+This module provides the ChatSession class, which keeps the message history
+of a multi-turn conversation so that it does not have to be rebuilt for
+every request.
+"""
+
+from typing import Any, Dict, List, Optional, Set
+
+from .provider import ToolCall
+from ..utils import serialization
+
+
+class ChatSession:
+    """
+    Message history of a multi-turn conversation.
+
+    Messages are stored in the chat completions format and appended one turn
+    at a time. Tool results and tool call arguments are serialized once, when
+    they are added, and reused for every later request of the conversation.
+    """
+
+    def __init__(self):
+        """Initialize an empty session."""
+        self.messages: List[Dict[str, Any]] = []
+        self._tool_result_ids: Set[str] = set()
+
+    def add_user(self, prompt: str) -> None:
+        """
+        Add a user message.
+
+        Args:
+            prompt: The user's prompt.
+        """
+        self.messages.append({"role": "user", "content": prompt})
+
+    def add_assistant(
+        self, content: Optional[str] = None, tool_calls: Optional[List[ToolCall]] = None
+    ) -> None:
+        """
+        Add an assistant message.
+
+        Args:
+            content: The text of the LLM's response.
+            tool_calls: Any tool calls requested by the LLM.
+        """
+        message: Dict[str, Any] = {"role": "assistant", "content": content}
+
+        if tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": tool_call.call_id,
+                    "type": "function",
+                    "function": {
+                        "name": tool_call.tool_name,
+                        "arguments": serialization.dumps(tool_call.arguments),
+                    },
+                }
+                for tool_call in tool_calls
+            ]
+
+        self.messages.append(message)
+
+    def add_tool_result(self, tool_id: str, result: Any) -> None:
+        """
+        Add the result of a tool call.
+
+        Args:
+            tool_id: The ID of the tool call the result belongs to.
+            result: The value returned by the tool, which must be JSON serializable.
+        """
+        self.messages.append(
+            {
+                "role": "tool",
+                "tool_call_id": tool_id,
+                "content": serialization.dumps(result),
+            }
+        )
+        self._tool_result_ids.add(tool_id)
+
+    def has_tool_result(self, tool_id: str) -> bool:
+        """
+        Check whether the result of a tool call was already added.
+
+        Args:
+            tool_id: The ID of the tool call.
+
+        Returns:
+            True if the session holds a result for the tool call.
+        """
+        return tool_id in self._tool_result_ids
+
+    def extend(self, other: "ChatSession") -> None:
+        """
+        Add the messages of another session, such as a turn built separately.
+
+        Args:
+            other: The session whose messages to add.
+        """
+        self.messages.extend(other.messages)
+        self._tool_result_ids.update(other._tool_result_ids)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Get the messages of the session.
+
+        Returns:
+            A new list holding the session's messages, which can be sent as the
+            ``messages`` of a request without being affected by later turns.
+        """
+        return list(self.messages)
+
+    def __len__(self) -> int:
+        """Return the number of messages in the session."""
+        return len(self.messages)
@@ -5,5 +5,5 @@ This package contains provider implementations for various LLM services.
 """
 
 # Import providers for easy access
-from .azure_openai import AzureOpenAIProvider, AzureOpenAIConfig
-from .openai import OpenAIProvider, OpenAIConfig
+from .azure_openai import AzureOpenAIProvider, AzureOpenAIConfig, AzureOpenAIError
+from .openai import OpenAIProvider, OpenAIConfig, OpenAIError
@@ -0,0 +1,200 @@
+"""
+Azure OpenAI batch module.
+
+This module provides the batch methods of the Azure OpenAI provider: concurrent
+requests with generate_batch, and batch jobs with submit_batch and
+fetch_batch_results.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from openai.types.chat import ChatCompletion
+
+from ..core.provider import LLMResponse
+from ..core.tool import Tool
+from ..utils import serialization
+from .errors import AzureOpenAIError, request_error
+
+
+logger = logging.getLogger(__name__)
+
+
+class AzureBatchMixin:
+    """
+    Batch methods of AzureOpenAIProvider.
+
+    They rely on the provider's _get_async_client, _build_request_params and
+    _parse_response.
+    """
+
+    async def generate_batch(
+        self,
+        prompts: List[str],
+        tools: Optional[List[Tool]] = None,
+        **kwargs,
+    ) -> List[LLMResponse]:
+        """
+        Generate responses for several independent prompts concurrently.
+
+        Each prompt is sent as its own request; the requests are awaited
+        together so their network round-trips overlap, up to the configured
+        ``max_concurrency``.
+
+        Args:
+            prompts: The prompts to send to the LLM.
+            tools: Optional list of tools to make available to the LLM.
+            **kwargs: Additional parameters for the Azure OpenAI API.
+
+        Returns:
+            The LLM's responses, in the same order as the prompts.
+
+        Raises:
+            AzureOpenAIError: If any of the Azure OpenAI API calls fails.
+        """
+        return list(
+            await asyncio.gather(
+                *(self.generate(prompt, tools, **kwargs) for prompt in prompts)
+            )
+        )
+
+    async def submit_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """
+        Submit several requests as an Azure OpenAI batch job.
+
+        Batch jobs complete within 24 hours at a lower cost and with separate
+        rate limits, which suits large offline workloads such as evaluations.
+        Each request is a dict with a ``prompt`` and optional ``tools``,
+        ``tool_results`` and ``custom_id`` entries; any other entry is treated
+        like a keyword argument of ``generate``. A request without a
+        ``custom_id`` gets its index in ``requests`` as ID.
+
+        Args:
+            requests: The requests to include in the batch.
+
+        Returns:
+            The ID of the batch job, to pass to ``fetch_batch_results``.
+
+        Raises:
+            AzureOpenAIError: If a request has no prompt, if two requests have
+                              the same ID, or if uploading the requests or
+                              creating the batch fails.
+        """
+        lines = []
+        custom_ids = set()
+        for index, request in enumerate(requests):
+            request = dict(request)
+            if "prompt" not in request:
+                raise AzureOpenAIError(f"Batch request {index} has no prompt")
+
+            # Reason: fetch_batch_results keys the results by custom_id, so a
+            # duplicate ID would silently drop one of the results
+            custom_id = str(request.pop("custom_id", index))
+            if custom_id in custom_ids:
+                raise AzureOpenAIError(
+                    f"Batch request {index} reuses the custom_id {custom_id!r}"
+                )
+            custom_ids.add(custom_id)
+
+            body, _ = self._build_request_params(
+                request.pop("prompt"),
+                request.pop("tools", None),
+                request.pop("tool_results", None),
+                **request,
+            )
+            lines.append(
+                serialization.dumps(
+                    {
+                        "custom_id": custom_id,
+                        "method": "POST",
+                        "url": "/chat/completions",
+                        "body": body,
+                    }
+                )
+            )
+
+        try:
+            client, _ = self._get_async_client()
+            batch_file = await client.files.create(
+                file=("batch.jsonl", "\n".join(lines).encode()),
+                purpose="batch",
+            )
+            batch = await client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/chat/completions",
+                completion_window="24h",
+            )
+            return batch.id
+
+        except Exception as e:
+            logger.error("Error submitting Azure OpenAI batch: %s", e)
+            raise request_error(e, "Azure OpenAI", AzureOpenAIError) from e
+
+    async def fetch_batch_results(
+        self, batch_id: str
+    ) -> Optional[Dict[str, LLMResponse]]:
+        """
+        Fetch the results of a batch job submitted with ``submit_batch``.
+
+        Args:
+            batch_id: The ID returned by ``submit_batch``.
+
+        Returns:
+            The responses keyed by ``custom_id``, or None if the batch job is
+            still running. Requests that failed get a response whose content
+            describes the error.
+
+        Raises:
+            AzureOpenAIError: If the batch job failed, expired or was cancelled,
+                              or if there's an error calling the Azure OpenAI API.
+        """
+        try:
+            client, _ = self._get_async_client()
+            batch = await client.batches.retrieve(batch_id)
+
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise AzureOpenAIError(f"Batch {batch_id} {batch.status}")
+            if batch.status != "completed":
+                return None
+
+            results: Dict[str, LLMResponse] = {}
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if not file_id:
+                    continue
+
+                file_content = await client.files.content(file_id)
+                for line in file_content.text.splitlines():
+                    if line.strip():
+                        custom_id, response = self._parse_batch_line(line)
+                        results[custom_id] = response
+
+            return results
+
+        except AzureOpenAIError:
+            raise
+        except Exception as e:
+            logger.error("Error fetching Azure OpenAI batch results: %s", e)
+            raise request_error(e, "Azure OpenAI", AzureOpenAIError) from e
+
+    def _parse_batch_line(self, line: str) -> tuple:
+        """
+        Parse one line of a batch output or error file.
+
+        Args:
+            line: A JSON line from the batch output or error file.
+
+        Returns:
+            A tuple of the request's custom_id and its LLMResponse.
+        """
+        record = serialization.loads(line)
+        response = record.get("response") or {}
+
+        if record.get("error") or response.get("status_code") != 200:
+            error = record.get("error") or response.get("body")
+            return record["custom_id"], LLMResponse(
+                content=f"Batch request failed: {error}"
+            )
+
+        completion = ChatCompletion.model_validate(response["body"])
+        return record["custom_id"], self._parse_response(completion)
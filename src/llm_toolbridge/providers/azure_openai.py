@@ -4,19 +4,38 @@ Azure OpenAI Provider module.
 This module provides the implementation of the Provider interface for Azure OpenAI.
 """
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Optional, Union
+import threading
+import weakref
+from typing import Any, Dict, List, MutableMapping, Optional, Tuple, Union
 
-from openai import AzureOpenAI
-from pydantic import BaseModel, Field
+from openai import AsyncAzureOpenAI, AzureOpenAI
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..core.provider import Provider, ProviderConfig, LLMResponse, ToolCall
+from ..core.session import ChatSession
 from ..core.tool import Tool
+from ..utils import serialization
+from ..utils.tool_format import ToolFormatter
+from .azure_batch import AzureBatchMixin
+from .azure_stream import AzureStreamMixin
+from .errors import AzureOpenAIError, request_error
 
 
 logger = logging.getLogger(__name__)
 
+# Sync clients shared between provider instances with the same credentials,
+# so they also share the underlying HTTP connection pool.
+_CLIENT_CACHE: Dict[tuple, AzureOpenAI] = {}
+
+# Request parameters that callers can override through **kwargs
+_OVERRIDABLE_PARAMS = ("temperature", "max_tokens", "top_p")
+
+# The async client of an event loop, and the semaphore limiting its requests
+_AsyncState = Tuple[AsyncAzureOpenAI, asyncio.Semaphore]
+
 
 class AzureOpenAIConfig(ProviderConfig):
     """
@@ -28,16 +47,27 @@ class AzureOpenAIConfig(ProviderConfig):
         deployment_name: The name of the deployment to use.
         api_version: The API version to use.
         organization: Optional organization for the API key.
+        max_retries: How many times to retry rate-limited (429), timed out
+                     and transient server or connection errors, with
+                     exponential backoff and jitter.
+        max_concurrency: Maximum number of requests a provider instance
+                         sends at the same time from async code.
     """
 
+    # Reason: configs are read-only once a provider is built from them, and
+    # unknown (e.g. misspelled) options should fail instead of being ignored
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     api_key: str
     endpoint: str
     deployment_name: str
     api_version: str = "2023-12-01-preview"
     organization: Optional[str] = None
+    max_retries: int = 4
+    max_concurrency: int = 10
 
 
-class AzureOpenAIProvider(Provider):
+class AzureOpenAIProvider(AzureBatchMixin, AzureStreamMixin, Provider):
     """
     Implementation of the Provider interface for Azure OpenAI.
 
@@ -54,15 +84,105 @@ class AzureOpenAIProvider(Provider):
         """
         self.config = config
 
-        # Initialize Azure OpenAI client
-        self.client = AzureOpenAI(
-            api_key=config.api_key,
-            api_version=config.api_version,
-            azure_endpoint=config.endpoint,
-            organization=config.organization,
-        )
+        # Initialize Azure OpenAI client, reusing a cached one when possible
+        self.client = self._get_client(config)
         self.deployment_name = config.deployment_name
 
+        # Request parameters shared by every call, overridable through kwargs
+        self._base_params: Dict[str, Any] = {
+            "model": self.deployment_name,
+            "temperature": 0.7,
+            "max_tokens": 800,
+            "top_p": 1.0,
+        }
+
+        # The async client and the semaphore limiting concurrent requests of
+        # each event loop, created lazily, see _get_async_client
+        self._async_state: MutableMapping[asyncio.AbstractEventLoop, _AsyncState] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._async_state_lock = threading.Lock()
+
+        # Formats tools, remembering the last toolset for repeated calls
+        self._tool_formatter = ToolFormatter()
+
+    @staticmethod
+    def _get_client(config: AzureOpenAIConfig) -> AzureOpenAI:
+        """
+        Get a sync Azure OpenAI client for the given configuration.
+
+        Clients are cached per endpoint, API version, API key, organization
+        and retry setting so that short-lived provider instances don't pay for
+        a new TCP/TLS connection on their first request.
+
+        Args:
+            config: The configuration for the Azure OpenAI provider.
+
+        Returns:
+            The shared client for this configuration.
+        """
+        key = (
+            config.endpoint,
+            config.api_version,
+            config.api_key,
+            config.organization,
+            config.max_retries,
+        )
+
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = AzureOpenAI(
+                api_key=config.api_key,
+                api_version=config.api_version,
+                azure_endpoint=config.endpoint,
+                organization=config.organization,
+                max_retries=config.max_retries,
+            )
+            _CLIENT_CACHE[key] = client
+
+        return client
+
+    def _get_async_client(self) -> _AsyncState:
+        """
+        Get the async Azure OpenAI client bound to the running event loop.
+
+        The client comes with the loop's semaphore, which async calls hold
+        while waiting on the API so that at most ``max_concurrency`` requests
+        are in flight on the loop, retries included.
+
+        Returns:
+            The async client and the semaphore for the current event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        # Reason: the underlying httpx connection pool is tied to the loop that
+        # opened it, so a client can't be reused from another loop (e.g. one
+        # asyncio.run call to the next). ToolBridge.execute_sync keeps one loop
+        # per thread, so each thread sharing a provider keeps its own client.
+        with self._async_state_lock:
+            state = self._async_state.get(loop)
+            if state is None:
+                # Reason: a client or semaphore that has waited on a loop holds
+                # a reference to it, which keeps the weak key alive, so drop
+                # the entries of closed loops here
+                closed_loops = [key for key in self._async_state if key.is_closed()]
+                for closed_loop in closed_loops:
+                    del self._async_state[closed_loop]
+
+                state = (
+                    AsyncAzureOpenAI(
+                        api_key=self.config.api_key,
+                        api_version=self.config.api_version,
+                        azure_endpoint=self.config.endpoint,
+                        organization=self.config.organization,
+                        max_retries=self.config.max_retries,
+                    ),
+                    asyncio.Semaphore(self.config.max_concurrency),
+                )
+                self._async_state[loop] = state
+
+        return state
+
     async def generate(
         self,
         prompt: str,
@@ -77,16 +197,32 @@ class AzureOpenAIProvider(Provider):
             prompt: The prompt to send to the LLM.
             tools: Optional list of tools to make available to the LLM.
             tool_results: Optional dictionary of results from previously called tools.
-            **kwargs: Additional parameters for the Azure OpenAI API.
+            **kwargs: Additional parameters for the Azure OpenAI API. A
+                      ``session`` (ChatSession) can be passed to continue a
+                      multi-turn conversation; the response is appended to it.
 
         Returns:
             The LLM's response.
 
         Raises:
-            Exception: If there's an error calling the Azure OpenAI API.
+            AzureOpenAIError: If there's an error calling the Azure OpenAI API.
         """
-        # Synchronous implementation for now (we'll add proper async later)
-        return self._generate_sync(prompt, tools, tool_results, **kwargs)
+        request_params, turn = self._build_request_params(
+            prompt, tools, tool_results, **kwargs
+        )
+
+        try:
+            # Make the API call without blocking the event loop
+            client, semaphore = self._get_async_client()
+            async with semaphore:
+                response = await client.chat.completions.create(**request_params)
+
+            # Parse the response
+            return self._record_response(self._parse_response(response), turn, **kwargs)
+
+        except Exception as e:
+            logger.error("Error calling Azure OpenAI: %s", e)
+            raise request_error(e, "Azure OpenAI", AzureOpenAIError) from e
 
     def _generate_sync(
         self,
@@ -108,7 +244,93 @@ class AzureOpenAIProvider(Provider):
             The LLM's response.
 
         Raises:
-            Exception: If there's an error calling the Azure OpenAI API.
+            AzureOpenAIError: If there's an error calling the Azure OpenAI API.
+        """
+        request_params, turn = self._build_request_params(
+            prompt, tools, tool_results, **kwargs
+        )
+
+        try:
+            # Make the API call using the client
+            response = self.client.chat.completions.create(**request_params)
+
+            # Parse the response
+            return self._record_response(self._parse_response(response), turn, **kwargs)
+
+        except Exception as e:
+            logger.error("Error calling Azure OpenAI: %s", e)
+            raise request_error(e, "Azure OpenAI", AzureOpenAIError) from e
+
+    def _build_request_params(
+        self,
+        prompt: str,
+        tools: Optional[List[Tool]] = None,
+        tool_results: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> Tuple[Dict[str, Any], Optional[ChatSession]]:
+        """
+        Build the chat completion request parameters.
+
+        When a ``session`` is passed in kwargs, its whole history is sent,
+        followed by the messages of this turn: the prompt, or the tool results
+        the session doesn't hold yet when tool results are being returned for
+        it. The turn is only added to the session by ``_record_response``,
+        once the request succeeded.
+
+        Args:
+            prompt: The prompt to send to the LLM.
+            tools: Optional list of tools to make available to the LLM.
+            tool_results: Optional dictionary of results from previously called tools.
+            **kwargs: Additional parameters for the Azure OpenAI API.
+
+        Returns:
+            The keyword arguments for ``chat.completions.create``, and the
+            messages of this turn if a session was passed.
+        """
+        session: Optional[ChatSession] = kwargs.get("session")
+        turn: Optional[ChatSession] = None
+        if session is not None:
+            turn = ChatSession()
+            if tool_results:
+                # Reason: ToolBridge passes every result of the conversation
+                # so far, including those sent in earlier rounds
+                for tool_id, result in tool_results.items():
+                    if not session.has_tool_result(tool_id):
+                        turn.add_tool_result(tool_id, result)
+            else:
+                turn.add_user(prompt)
+            messages = session.snapshot() + turn.messages
+        else:
+            messages = self._build_messages(prompt, tool_results)
+
+        # Prepare request parameters from the defaults set up in __init__
+        request_params = {**self._base_params, "messages": messages}
+        request_params.update(
+            {key: kwargs[key] for key in _OVERRIDABLE_PARAMS if key in kwargs}
+        )
+
+        # Add tools if provided
+        if tools:
+            formatted_tools = self.format_tools_for_provider(tools)
+            request_params["tools"] = formatted_tools
+            # Only add tool_choice if tools are provided
+            request_params["tool_choice"] = kwargs.get("tool_choice", "auto")
+
+        return request_params, turn
+
+    @staticmethod
+    def _build_messages(
+        prompt: str, tool_results: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the messages of a single-turn request.
+
+        Args:
+            prompt: The prompt to send to the LLM.
+            tool_results: Optional dictionary of results from previously called tools.
+
+        Returns:
+            The messages for ``chat.completions.create``.
         """
         messages = [{"role": "user", "content": prompt}]
 
@@ -120,36 +342,33 @@ class AzureOpenAIProvider(Provider):
                     {
                         "role": "assistant",
                         "tool_call_id": tool_id,
-                        "content": json.dumps(result),
+                        "content": serialization.dumps(result),
                     }
                 )
 
-        # Prepare request parameters
-        request_params = {
-            "model": self.deployment_name,
-            "messages": messages,
-            "temperature": kwargs.get("temperature", 0.7),
-            "max_tokens": kwargs.get("max_tokens", 800),
-            "top_p": kwargs.get("top_p", 1.0),
-        }
+        return messages
 
-        # Add tools if provided
-        if tools:
-            formatted_tools = self.format_tools_for_provider(tools)
-            request_params["tools"] = formatted_tools
-            # Only add tool_choice if tools are provided
-            request_params["tool_choice"] = kwargs.get("tool_choice", "auto")
+    @staticmethod
+    def _record_response(
+        response: LLMResponse, turn: Optional[ChatSession], **kwargs
+    ) -> LLMResponse:
+        """
+        Append a turn and its response to the ``session`` passed in kwargs, if any.
 
-        try:
-            # Make the API call using the client
-            response = self.client.chat.completions.create(**request_params)
+        Args:
+            response: The parsed response from Azure OpenAI.
+            turn: The messages of the request, from ``_build_request_params``.
+            **kwargs: The keyword arguments the request was made with.
 
-            # Parse the response
-            return self._parse_response(response)
+        Returns:
+            The response, unchanged.
+        """
+        session: Optional[ChatSession] = kwargs.get("session")
+        if session is not None:
+            session.extend(turn)
+            session.add_assistant(response.content, response.tool_calls)
 
-        except Exception as e:
-            logger.error(f"Error calling Azure OpenAI: {e}")
-            raise Exception(f"Azure OpenAI API request failed: {str(e)}")
+        return response
 
     def format_tools_for_provider(self, tools: List[Tool]) -> List[Dict[str, Any]]:
         """
@@ -160,18 +379,13 @@ class AzureOpenAIProvider(Provider):
 
         Returns:
             The tools formatted for Azure OpenAI.
-        """
-        formatted_tools = []
-
-        for tool in tools:
-            # Leverage the to_dict method from the Tool class
-            tool_dict = {"type": "function", "function": tool.to_dict()}
-
-            # The to_dict method already handles parameter formatting correctly,
-            # including handling both dict and ParameterDefinition objects
-            formatted_tools.append(tool_dict)
 
-        return formatted_tools
+        Note:
+            Formatted definitions are cached by tool content, and the list
+            for the last toolset is kept by the provider, so the returned
+            list and its definitions should not be modified.
+        """
+        return self._tool_formatter.format(tools)
 
     def parse_tool_calls(self, raw_response: Any) -> List[ToolCall]:
         """
@@ -193,47 +407,52 @@ class AzureOpenAIProvider(Provider):
         tool_calls = []
 
         try:
-            # Extract choices from the response object
-            choices = raw_response.choices if hasattr(raw_response, "choices") else []
-
-            for choice in choices:
-                # Get message from the choice
-                message = choice.message if hasattr(choice, "message") else None
-
-                # Get tool_calls from the message
-                raw_tool_calls = (
-                    message.tool_calls
-                    if message and hasattr(message, "tool_calls")
-                    else []
-                )
+            # The client returns typed models, so the attributes always exist;
+            # tool_calls is None when the model answered with plain text
+            for choice in raw_response.choices:
+                for raw_call in choice.message.tool_calls or []:
+                    if raw_call.type != "function":
+                        continue
 
-                for raw_call in raw_tool_calls:
-                    if hasattr(raw_call, "type") and raw_call.type == "function":
-                        # Extract function details
-                        function_data = raw_call.function
+                    # Extract function details
+                    function_data = raw_call.function
 
-                        # Parse arguments as JSON
-                        arguments = {}
-                        try:
-                            arguments_str = function_data.arguments
-                            arguments = json.loads(arguments_str)
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Error parsing tool call arguments: {e}")
-                            arguments = {"error": "Invalid JSON in arguments"}
+                    tool_call = ToolCall(
+                        tool_name=function_data.name,
+                        arguments=self._parse_arguments(function_data.arguments),
+                        call_id=raw_call.id,
+                    )
 
-                        tool_call = ToolCall(
-                            tool_name=function_data.name,
-                            arguments=arguments,
-                            call_id=raw_call.id,
-                        )
-
-                        tool_calls.append(tool_call)
+                    tool_calls.append(tool_call)
 
         except Exception as e:
-            logger.error(f"Error parsing tool calls: {e}")
+            logger.error("Error parsing tool calls: %s", e)
 
         return tool_calls
 
+    @staticmethod
+    def _parse_arguments(arguments_str: str) -> Dict[str, Any]:
+        """
+        Parse the JSON arguments of a tool call.
+
+        Args:
+            arguments_str: The raw JSON arguments string from the API.
+
+        Returns:
+            The parsed arguments, or an error entry if they are not valid JSON.
+        """
+        # Reason: skip the parse, and the exception it would raise, for
+        # arguments that can't be an object
+        if not serialization.looks_like_object(arguments_str):
+            logger.error("Tool call arguments are not a JSON object")
+            return {"error": "Invalid JSON in arguments"}
+
+        try:
+            return serialization.loads(arguments_str)
+        except json.JSONDecodeError as e:
+            logger.error("Error parsing tool call arguments: %s", e)
+            return {"error": "Invalid JSON in arguments"}
+
     def _parse_response(self, response: Any) -> LLMResponse:
         """
         Parse the response from Azure OpenAI API into our standard LLMResponse format.
@@ -256,19 +475,17 @@ class AzureOpenAIProvider(Provider):
         """
         try:
             # Check if we have choices in the response
-            if not hasattr(response, "choices") or not response.choices:
+            choices = getattr(response, "choices", None)
+            if not choices:
                 return LLMResponse(content="No response generated")
 
-            # Get the first choice
-            choice = response.choices[0]
-
-            # Get the message from the choice
-            message = choice.message if hasattr(choice, "message") else None
+            # Extract content from the first choice's message
+            message = choices[0].message
+            content = message.content
 
-            # Extract content
-            content = (
-                message.content if message and hasattr(message, "content") else None
-            )
+            # Plain text answer: nothing to parse
+            if not message.tool_calls and len(choices) == 1:
+                return LLMResponse(content=content)
 
             # Parse tool calls
             tool_calls = self.parse_tool_calls(response)
@@ -276,5 +493,5 @@ class AzureOpenAIProvider(Provider):
             return LLMResponse(content=content, tool_calls=tool_calls)
 
         except Exception as e:
-            logger.error(f"Error parsing Azure OpenAI response: {e}")
+            logger.error("Error parsing Azure OpenAI response: %s", e)
             return LLMResponse(content=f"Error parsing response: {str(e)}")
@@ -0,0 +1,126 @@
+"""
+Azure OpenAI streaming module.
+
+This module provides the streaming method of the Azure OpenAI provider.
+"""
+
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from ..core.provider import LLMResponse, ToolCall
+from ..core.tool import Tool
+from .errors import AzureOpenAIError, request_error
+
+
+logger = logging.getLogger(__name__)
+
+
+class AzureStreamMixin:
+    """
+    Streaming method of AzureOpenAIProvider.
+
+    It relies on the provider's _get_async_client, _build_request_params,
+    _parse_arguments and _record_response.
+    """
+
+    async def stream_generate(
+        self,
+        prompt: str,
+        tools: Optional[List[Tool]] = None,
+        tool_results: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ) -> AsyncIterator[LLMResponse]:
+        """
+        Stream a response from Azure OpenAI.
+
+        Text is yielded as soon as it arrives, one LLMResponse per content
+        delta. Tool call fragments are accumulated while streaming and yielded
+        in a final LLMResponse once the stream ends.
+
+        The request holds a ``max_concurrency`` slot until the stream ends or
+        the generator is closed, so a consumer that stops early should call
+        its ``aclose()`` (or use ``contextlib.aclosing``) to free the slot and
+        the connection right away.
+
+        Args:
+            prompt: The prompt to send to the LLM.
+            tools: Optional list of tools to make available to the LLM.
+            tool_results: Optional dictionary of results from previously called tools.
+            **kwargs: Additional parameters for the Azure OpenAI API. A
+                      ``session`` (ChatSession) can be passed to continue a
+                      multi-turn conversation; the whole response is appended
+                      to it once the stream has been read to the end.
+
+        Yields:
+            LLMResponse: Partial responses as the completion is generated.
+
+        Raises:
+            AzureOpenAIError: If there's an error calling the Azure OpenAI API.
+        """
+        request_params, turn = self._build_request_params(
+            prompt, tools, tool_results, **kwargs
+        )
+        request_params["stream"] = True
+
+        # Text deltas, and tool call fragments by index: id, function name
+        # and raw arguments
+        content_parts: List[str] = []
+        partial_calls: Dict[int, Dict[str, Any]] = {}
+
+        try:
+            client, semaphore = self._get_async_client()
+
+            # The request is in flight until the whole stream has been read
+            async with semaphore:
+                stream = await client.chat.completions.create(**request_params)
+
+                try:
+                    async for chunk in stream:
+                        # Azure sends content filter results in chunks without choices
+                        if not chunk.choices:
+                            continue
+
+                        delta = chunk.choices[0].delta
+
+                        if delta.content:
+                            content_parts.append(delta.content)
+                            yield LLMResponse(content=delta.content)
+
+                        for call_delta in delta.tool_calls or []:
+                            partial = partial_calls.setdefault(
+                                call_delta.index,
+                                {"id": None, "name": "", "arguments": ""},
+                            )
+                            if call_delta.id:
+                                partial["id"] = call_delta.id
+                            if call_delta.function:
+                                partial["name"] += call_delta.function.name or ""
+                                partial["arguments"] += (
+                                    call_delta.function.arguments or ""
+                                )
+                finally:
+                    # Reason: a consumer that stops early closes this generator
+                    # mid-stream; release the connection along with the slot
+                    await stream.close()
+
+        except Exception as e:
+            logger.error("Error calling Azure OpenAI: %s", e)
+            raise request_error(e, "Azure OpenAI", AzureOpenAIError) from e
+
+        # Reason: arguments are only valid JSON once every fragment arrived
+        tool_calls = [
+            ToolCall(
+                tool_name=partial["name"],
+                arguments=self._parse_arguments(partial["arguments"]),
+                call_id=partial["id"],
+            )
+            for _, partial in sorted(partial_calls.items())
+        ]
+        self._record_response(
+            LLMResponse(content="".join(content_parts) or None, tool_calls=tool_calls),
+            turn,
+            **kwargs,
+        )
+
+        if tool_calls:
+            yield LLMResponse(tool_calls=tool_calls)
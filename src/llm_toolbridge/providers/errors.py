@@ -0,0 +1,48 @@
+"""
+Provider errors module.
+
+This module provides the errors raised by the providers built on the OpenAI
+SDK, and the helper they use to wrap the errors raised while calling their API.
+"""
+
+from typing import Type, TypeVar
+
+import openai
+
+E = TypeVar("E", bound=Exception)
+
+
+class AzureOpenAIError(Exception):
+    """Raised when a request to the Azure OpenAI API fails."""
+
+
+class OpenAIError(Exception):
+    """Raised when a request to the OpenAI API fails."""
+
+
+def request_error(e: Exception, api_name: str, error_class: Type[E]) -> E:
+    """
+    Wrap an error raised while calling an API through the OpenAI SDK.
+
+    Args:
+        e: The error raised by the OpenAI SDK.
+        api_name: The name of the API, used as the prefix of the message
+                  (e.g. "Azure OpenAI").
+        error_class: The provider's error type to wrap the error in.
+
+    Returns:
+        An error_class instance whose message tells timeouts, connection
+        errors, rate limiting and authentication errors apart.
+    """
+    # APITimeoutError is a subclass of APIConnectionError, so check it first
+    if isinstance(e, (openai.APITimeoutError, TimeoutError)):
+        return error_class(f"{api_name} API request timed out: {e}")
+    if isinstance(e, (openai.APIConnectionError, ConnectionError)):
+        reason = " (connection error)"
+    elif isinstance(e, openai.RateLimitError):
+        reason = " (rate limited)"
+    elif isinstance(e, openai.AuthenticationError):
+        reason = " (authentication error)"
+    else:
+        reason = ""
+    return error_class(f"{api_name} API request failed{reason}: {e}")
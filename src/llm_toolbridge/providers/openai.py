@@ -4,6 +4,7 @@ OpenAI Provider module.
 This module provides the implementation of the Provider interface for OpenAI API.
 """
 
+import asyncio
 import json
 import logging
 from typing import Any, Dict, List, Optional, Union
@@ -13,11 +14,19 @@ from pydantic import BaseModel, Field
 
 from ..core.provider import Provider, ProviderConfig, LLMResponse, ToolCall
 from ..core.tool import Tool
+from ..utils import serialization
+from ..utils.tool_format import ToolFormatter
+from .errors import OpenAIError, request_error
 
 
 logger = logging.getLogger(__name__)
 
 
+def _request_error(e: Exception) -> OpenAIError:
+    """Wrap an error raised while calling the OpenAI API."""
+    return request_error(e, "OpenAI", OpenAIError)
+
+
 class OpenAIConfig(ProviderConfig):
     """
     Configuration for OpenAI provider.
@@ -66,6 +75,9 @@ class OpenAIProvider(Provider):
         self.client = OpenAI(**client_kwargs)
         self.model = config.model
 
+        # Formats tools, remembering the last toolset for repeated calls
+        self._tool_formatter = ToolFormatter()
+
     async def generate(
         self,
         prompt: str,
@@ -86,10 +98,13 @@ class OpenAIProvider(Provider):
             The LLM's response.
 
         Raises:
-            Exception: If there's an error calling the OpenAI API.
+            OpenAIError: If there's an error calling the OpenAI API.
         """
-        # Synchronous implementation for now (we'll add proper async later)
-        return self._generate_sync(prompt, tools, tool_results, **kwargs)
+        # Run the blocking client call in a worker thread so the event loop
+        # stays free while the request is in flight
+        return await asyncio.to_thread(
+            self._generate_sync, prompt, tools, tool_results, **kwargs
+        )
 
     def _generate_sync(
         self,
@@ -111,7 +126,7 @@ class OpenAIProvider(Provider):
             The LLM's response.
 
         Raises:
-            Exception: If there's an error calling the OpenAI API.
+            OpenAIError: If there's an error calling the OpenAI API.
         """
         messages = [{"role": "user", "content": prompt}]
 
@@ -156,7 +171,7 @@ class OpenAIProvider(Provider):
 
         except Exception as e:
             logger.error(f"Error calling OpenAI: {e}")
-            raise Exception(f"OpenAI API request failed: {str(e)}")
+            raise _request_error(e) from e
 
     def format_tools_for_provider(self, tools: List[Tool]) -> List[Dict[str, Any]]:
         """
@@ -167,18 +182,13 @@ class OpenAIProvider(Provider):
 
         Returns:
             The tools formatted for OpenAI.
-        """
-        formatted_tools = []
 
-        for tool in tools:
-            # Leverage the to_dict method from the Tool class
-            tool_dict = {"type": "function", "function": tool.to_dict()}
-
-            # The to_dict method already handles parameter formatting correctly,
-            # including handling both dict and ParameterDefinition objects
-            formatted_tools.append(tool_dict)
-
-        return formatted_tools
+        Note:
+            Formatted definitions are cached by tool content, and the list
+            for the last toolset is kept by the provider, so the returned
+            list and its definitions should not be modified.
+        """
+        return self._tool_formatter.format(tools)
 
     def parse_tool_calls(self, raw_response: Any) -> List[ToolCall]:
         """
@@ -221,12 +231,16 @@ class OpenAIProvider(Provider):
 
                         # Parse arguments as JSON
                         arguments = {}
-                        try:
-                            arguments_str = function_data.arguments
-                            arguments = json.loads(arguments_str)
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Error parsing tool call arguments: {e}")
+                        arguments_str = function_data.arguments
+                        if not serialization.looks_like_object(arguments_str):
+                            logger.error("Tool call arguments are not a JSON object")
                             arguments = {"error": "Invalid JSON in arguments"}
+                        else:
+                            try:
+                                arguments = serialization.loads(arguments_str)
+                            except json.JSONDecodeError as e:
+                                logger.error(f"Error parsing tool call arguments: {e}")
+                                arguments = {"error": "Invalid JSON in arguments"}
 
                         tool_call = ToolCall(
                             tool_name=function_data.name,
@@ -6,14 +6,37 @@ to simplify configuration of examples and applications.
 """
 
 import os
+import re
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+
+# A KEY=value assignment on a single line. The value is either double quoted,
+# single quoted or bare; a bare value ends at a whitespace-prefixed "#" comment.
+# Blank lines, comment lines and anything else simply don't match.
+_LINE_PATTERN = re.compile(
+    r"""^[ \t]*([A-Za-z_]\w*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|(.*?))"""
+    r"""[ \t]*(?:[ \t]#.*)?$""",
+    re.MULTILINE,
+)
+
+
+# Parsed .env contents by resolved file path, with the modification time and
+# size of the file they were parsed from, and the .env path discovered for each
+# working directory (None when there is none). Loading an unchanged file again
+# re-applies the cached values after a single stat call.
+_DOTENV_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+_DISCOVERED_PATHS: Dict[str, Optional[str]] = {}
 
 
 def load_dotenv(dotenv_path: Optional[str] = None) -> Dict[str, str]:
     """
     Load environment variables from a .env file.
 
+    Files are parsed once per version; later calls for the same, unchanged
+    file set the cached values again without re-reading it.
+
     Args:
         dotenv_path: Path to the .env file. If None, looks for .env in current
                      directory and parent directories.
@@ -27,44 +50,77 @@ def load_dotenv(dotenv_path: Optional[str] = None) -> Dict[str, str]:
     """
     # If no path specified, search for .env in current and parent directories
     if dotenv_path is None:
-        current_dir = Path.cwd()
+        dotenv_path = _find_dotenv()
+
+    # If no .env file found, return empty dict
+    if dotenv_path is None:
+        return {}
+
+    # Reason: key on the resolved path, so that a relative path loaded from
+    # another working directory doesn't get the first directory's values
+    resolved_path = str(Path(dotenv_path).resolve())
+    try:
+        stat = os.stat(resolved_path)
+    except OSError:
+        return {}
+
+    # An edited file has a new modification time or size, and is parsed again
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _DOTENV_CACHE.get(resolved_path)
+    if cached is not None and cached[0] == version:
+        loaded_vars = cached[1]
+    else:
+        loaded_vars = _parse_dotenv(resolved_path)
+        _DOTENV_CACHE[resolved_path] = (version, loaded_vars)
+
+    # Set environment variables, also when they come from the cache
+    os.environ.update(loaded_vars)
+
+    return dict(loaded_vars)
+
+
+def _find_dotenv() -> Optional[str]:
+    """
+    Find the .env file for the current working directory.
+
+    Returns:
+        The path of the first .env file in the current directory or its two
+        parents, or None if there is none.
+    """
+    current_dir = Path.cwd()
+    cache_key = str(current_dir)
+
+    if cache_key not in _DISCOVERED_PATHS:
+        _DISCOVERED_PATHS[cache_key] = None
         # Try current directory and up to two parent directories
         for dir_path in [current_dir, current_dir.parent, current_dir.parent.parent]:
             potential_path = dir_path / ".env"
             if potential_path.exists():
-                dotenv_path = str(potential_path)
+                _DISCOVERED_PATHS[cache_key] = str(potential_path)
                 break
 
-    # If no .env file found, return empty dict
-    if dotenv_path is None or not Path(dotenv_path).exists():
-        return {}
+    return _DISCOVERED_PATHS[cache_key]
 
-    # Parse the .env file
-    loaded_vars = {}
-    with open(dotenv_path, "r") as file:
-        for line in file:
-            line = line.strip()
-            # Skip empty lines and comments
-            if not line or line.startswith("#"):
-                continue
-
-            # Parse key-value pairs
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Remove quotes if present
-                if (value.startswith('"') and value.endswith('"')) or (
-                    value.startswith("'") and value.endswith("'")
-                ):
-                    value = value[1:-1]
-
-                # Set environment variable and track it
-                os.environ[key] = value
-                loaded_vars[key] = value
-
-    return loaded_vars
+
+def _parse_dotenv(dotenv_path: str) -> Dict[str, str]:
+    """
+    Parse the assignments in a .env file.
+
+    Args:
+        dotenv_path: Path to the .env file.
+
+    Returns:
+        Dict of the variables defined in the file.
+    """
+    # Parse the .env file in a single pass over its contents
+    parsed_vars = {}
+    text = Path(dotenv_path).read_text()
+    for match in _LINE_PATTERN.finditer(text):
+        # Only one of the value groups takes part in a match
+        value = match.group(2) or match.group(3) or match.group(4) or ""
+        parsed_vars[match.group(1)] = value
+
+    return parsed_vars
 
 
 def get_env_var(key: str, default: Optional[str] = None) -> Optional[str]:
@@ -0,0 +1,136 @@
+"""
+JSON serialization utility.
+
+This module provides JSON helpers that use orjson when it is installed and
+fall back to the standard library json module otherwise.
+"""
+
+import json
+import math
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional speedup, see the "speedups" extra
+
+if orjson is not None:
+    # Reason: orjson serializes datetimes and dataclasses, which the json
+    # module rejects; pass them through so they raise TypeError and take the
+    # json fallback in dumps, which raises TypeError too
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+# A run of 19 digits or more, which may be an integer wider than 64 bits: orjson
+# parses those into floats where the json module keeps the exact int
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+# The json module output that matches orjson's: compact, and UTF-8 rather
+# than ASCII escapes
+_JSON_OPTIONS = {"separators": (",", ":"), "ensure_ascii": False}
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """
+    Check whether an object holds NaN or an infinite float.
+
+    Args:
+        obj: The object to check, as passed to dumps.
+
+    Returns:
+        True if a float in the object, its lists, tuples or dict values is
+        NaN or infinite.
+    """
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    The output is the same with both backends: compact, with non-ASCII
+    characters kept as is.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns:
+        The JSON representation of the object.
+
+    Raises:
+        TypeError: If the object is not JSON serializable.
+    """
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # Reason: orjson rejects a few values the json module accepts,
+            # such as integers wider than 64 bits
+            pass
+        else:
+            # Reason: orjson writes NaN and infinities as null, where the json
+            # module writes NaN and Infinity. Only look for them when there's
+            # a null, so most payloads aren't walked twice.
+            if b"null" not in data or not _has_non_finite(obj):
+                return data.decode()
+
+    return json.dumps(obj, **_JSON_OPTIONS)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserialize a JSON string.
+
+    The result is the same with both backends: integers keep their exact
+    value however wide they are, and NaN, Infinity and -Infinity are accepted.
+
+    Args:
+        data: The JSON document to parse.
+
+    Returns:
+        The parsed object.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if orjson is not None:
+        long_digits = _LONG_DIGITS_BYTES if isinstance(data, bytes) else _LONG_DIGITS
+        if not long_digits.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # Reason: orjson rejects NaN, infinities and numbers too large
+                # for a float, which the json module accepts; it raises
+                # json.JSONDecodeError itself for documents that are invalid
+                pass
+
+    return json.loads(data)
+
+
+def looks_like_object(data: str) -> bool:
+    """
+    Cheaply check whether a string could be a JSON object.
+
+    This only looks at the first and last non-whitespace characters, so it
+    lets callers reject obviously malformed input without paying for a
+    failed parse. A True result does not mean the string is valid JSON.
+
+    Args:
+        data: The JSON document to check.
+
+    Returns:
+        False if the string can't be a JSON object, True otherwise.
+    """
+    data = data.strip()
+    return data[:1] == "{" and data[-1:] == "}"
@@ -0,0 +1,99 @@
+"""
+Tool formatting utility.
+
+This module formats tools for the chat completions API used by the OpenAI and
+Azure OpenAI providers, and caches the formatted definitions by tool content.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from ..core.tool import Tool
+
+# Formatted tool definitions keyed by the content of the Tool they were built
+# from (see _tool_key), least recently used first
+_TOOL_CACHE: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_TOOL_CACHE_SIZE = 256
+_TOOL_CACHE_LOCK = threading.Lock()
+
+
+def _tool_key(tool: Tool) -> str:
+    """
+    Build the key a Tool's formatted definition is cached under.
+
+    Args:
+        tool: The tool to build the key for.
+
+    Returns:
+        The tool's fields as JSON, so that a Tool modified after it was
+        formatted gets a new key instead of its stale definition.
+    """
+    return tool.model_dump_json(exclude={"function"})
+
+
+def _format_tool(tool: Tool, key: str) -> Dict[str, Any]:
+    """
+    Format a tool, reusing the cached definition for its key if any.
+
+    Args:
+        tool: The tool to format.
+        key: The tool's key, from _tool_key.
+
+    Returns:
+        The formatted tool definition, shared by every caller.
+    """
+    with _TOOL_CACHE_LOCK:
+        tool_dict = _TOOL_CACHE.get(key)
+        if tool_dict is not None:
+            _TOOL_CACHE.move_to_end(key)
+            return tool_dict
+
+    # Leverage the to_dict method from the Tool class
+    tool_dict = {"type": "function", "function": tool.to_dict()}
+
+    # The to_dict method already handles parameter formatting correctly,
+    # including handling both dict and ParameterDefinition objects
+    with _TOOL_CACHE_LOCK:
+        _TOOL_CACHE[key] = tool_dict
+        if len(_TOOL_CACHE) > _TOOL_CACHE_SIZE:
+            _TOOL_CACHE.popitem(last=False)
+
+    return tool_dict
+
+
+class ToolFormatter:
+    """
+    Formats toolsets for the chat completions API.
+
+    Each provider keeps its own formatter, which remembers the last toolset it
+    formatted, so a toolset sent on every call is formatted once.
+    """
+
+    def __init__(self):
+        """Initialize a formatter that hasn't formatted any tools yet."""
+        # The keys of the last toolset formatted and its formatted list
+        self._last: Tuple[tuple, List[Dict[str, Any]]] = ((), [])
+
+    def format(self, tools: List[Tool]) -> List[Dict[str, Any]]:
+        """
+        Format a list of tools for the chat completions API.
+
+        Args:
+            tools: The tools to format.
+
+        Returns:
+            The formatted tools. The list and its definitions are cached, so
+            they should not be modified.
+        """
+        key = tuple(_tool_key(tool) for tool in tools)
+        last_key, last_tools = self._last
+        if key == last_key:
+            return last_tools
+
+        formatted_tools = [
+            _format_tool(tool, tool_key) for tool, tool_key in zip(tools, key)
+        ]
+        self._last = (key, formatted_tools)
+
+        return formatted_tools
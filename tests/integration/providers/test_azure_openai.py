@@ -12,7 +12,11 @@ import os
 import pytest
 from llm_toolbridge.core.bridge import ToolBridge
 from llm_toolbridge.core.tool import Tool, ParameterDefinition
-from llm_toolbridge.providers.azure_openai import AzureOpenAIProvider, AzureOpenAIConfig
+from llm_toolbridge.providers.azure_openai import (
+    AzureOpenAIProvider,
+    AzureOpenAIConfig,
+    AzureOpenAIError,
+)
 from llm_toolbridge.utils.env_loader import load_dotenv, get_env_var
 
 # Load environment variables from .env if present
@@ -80,8 +84,6 @@ class TestAzureOpenAIProviderIntegration:
         response = self.bridge.execute_sync(prompt)
         assert response.content is not None
         assert isinstance(response.content, str)
-        breakpoint()  # Debugging point to inspect the response
-        print(f"Response content: {response}")
 
     def test_edge_case_empty_prompt(self):
         """Test with an empty prompt (edge case)."""
@@ -101,5 +103,5 @@ class TestAzureOpenAIProviderIntegration:
         )
         bad_provider = AzureOpenAIProvider(bad_config)
         bad_bridge = ToolBridge(bad_provider)
-        with pytest.raises(Exception):
+        with pytest.raises(AzureOpenAIError):
             bad_bridge.execute_sync("Test with invalid credentials")
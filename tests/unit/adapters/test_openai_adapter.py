@@ -0,0 +1,117 @@
+"""
+Unit tests for the OpenAI adapter.
+"""
+
+import copy
+from unittest.mock import Mock, patch
+
+import pytest
+
+from llm_toolbridge.adapters.openai import OpenAIAdapter
+from llm_toolbridge.core.adapter_registry import AdapterRegistry
+from llm_toolbridge.core.provider import LLMResponse, ToolCall
+from llm_toolbridge.providers.openai import OpenAIProvider, OpenAIConfig
+
+
+# A response with a tool call, only ever read by the tests
+_PARSE_RESPONSE_FIXTURE = LLMResponse(
+    content="Test content",
+    tool_calls=[
+        ToolCall(tool_name="calculator", arguments={"x": 5, "y": 3}, call_id="call_123")
+    ],
+)
+
+
+@pytest.fixture(scope="module")
+def shared_adapter():
+    """
+    An OpenAIAdapter around a provider with a mocked client, built once.
+
+    Only use it in tests that don't modify the adapter or its provider; use
+    the adapter fixture for those.
+    """
+    config = OpenAIConfig(api_key="test-key", model="gpt-4")
+
+    with patch("llm_toolbridge.providers.openai.OpenAI"):
+        provider = OpenAIProvider(config)
+
+    return OpenAIAdapter(provider)
+
+
+@pytest.fixture
+def adapter(shared_adapter):
+    """A copy of shared_adapter, with its own copy of the provider."""
+    adapter = copy.copy(shared_adapter)
+    adapter.provider = copy.copy(shared_adapter.provider)
+    return adapter
+
+
+def test_init_rejects_other_providers():
+    """Test that the adapter only accepts an OpenAIProvider."""
+    with pytest.raises(TypeError, match="requires an OpenAIProvider"):
+        OpenAIAdapter(object())
+
+
+def test_registered_class():
+    """Test that importing the adapters package registers OpenAIAdapter."""
+    assert AdapterRegistry.get_adapter_class("openai") is OpenAIAdapter
+
+
+def test_registry_creates_adapter(shared_adapter):
+    """Test that the registry wraps an OpenAIProvider in an OpenAIAdapter."""
+    adapter = AdapterRegistry.create_adapter("openai", shared_adapter.provider)
+
+    assert isinstance(adapter, OpenAIAdapter)
+    assert adapter.provider is shared_adapter.provider
+
+
+def test_get_capabilities(shared_adapter):
+    """Test the capabilities reported for OpenAI."""
+    capabilities = shared_adapter.get_capabilities()
+
+    assert capabilities.supports_tool_calling
+    assert capabilities.supports_multiple_tools
+    assert not capabilities.supports_streaming
+
+
+def test_prepare_request(shared_adapter, calculator_tool):
+    """Test that the request holds the prompt, tools, results and extra options."""
+    request = shared_adapter.prepare_request(
+        "Hello", [calculator_tool], tool_results={"call_1": 8}, temperature=0.2
+    )
+
+    assert request == {
+        "prompt": "Hello",
+        "tools": [calculator_tool],
+        "tool_results": {"call_1": 8},
+        "temperature": 0.2,
+    }
+
+
+def test_execute_request(adapter, shared_adapter):
+    """Test that the request is passed to the provider's _generate_sync."""
+    expected = LLMResponse(content="Hi there")
+    adapter.provider._generate_sync = Mock(return_value=expected)
+
+    response = adapter.execute_request(
+        adapter.prepare_request("Hello", temperature=0.2)
+    )
+
+    assert response is expected
+    generate = adapter.provider._generate_sync
+    assert generate.call_count == 1
+    assert generate.call_args.kwargs == {
+        "prompt": "Hello",
+        "tools": None,
+        "tool_results": None,
+        "temperature": 0.2,
+    }
+    # The stub didn't leak into the shared provider
+    assert "_generate_sync" not in vars(shared_adapter.provider)
+
+
+def test_parse_response(shared_adapter):
+    """Test that the provider's LLMResponse is passed through unchanged."""
+    parsed = shared_adapter.parse_response(_PARSE_RESPONSE_FIXTURE)
+
+    assert parsed is _PARSE_RESPONSE_FIXTURE
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for all unit tests.
+"""
+
+import pytest
+
+from llm_toolbridge.core.tool import Tool, ParameterDefinition
+
+
+@pytest.fixture(scope="session")
+def calculator_tool():
+    """
+    A calculator tool shared by every test.
+
+    Providers and adapters only read the tools they are given, so don't
+    mutate it.
+    """
+    return Tool(
+        name="calculator",
+        description="Performs mathematical calculations",
+        parameters={
+            "operation": ParameterDefinition(
+                type="string",
+                description="The operation to perform",
+                enum=["add", "subtract", "multiply", "divide"],
+            ),
+            "x": ParameterDefinition(type="number", description="First operand"),
+            "y": ParameterDefinition(type="number", description="Second operand"),
+        },
+    )
@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the core unit tests.
+"""
+
+import asyncio
+
+import pytest
+
+from llm_toolbridge.core.bridge import ToolBridge
+from llm_toolbridge.core.provider import Provider, ProviderConfig, LLMResponse
+
+
+class DummyProvider(Provider):
+    """
+    Stateless implementation of Provider for testing.
+    """
+
+    def __init__(self, config: ProviderConfig):
+        self.config = config
+
+    async def generate(self, prompt: str, tools=None, tool_results=None, **kwargs):
+        return LLMResponse(content="test", tool_calls=[])
+
+    def format_tools_for_provider(self, tools):
+        return []
+
+    def parse_tool_calls(self, raw_response):
+        return []
+
+
+@pytest.fixture(scope="session")
+def provider_config():
+    """A ProviderConfig shared by every test."""
+    return ProviderConfig()
+
+
+@pytest.fixture(scope="session")
+def dummy_provider(provider_config):
+    """A DummyProvider shared by every test, since it holds no state."""
+    return DummyProvider(provider_config)
+
+
+@pytest.fixture(scope="session")
+def readonly_bridge(dummy_provider):
+    """
+    A ToolBridge with no tools registered, shared by every test.
+
+    Do not mutate it (e.g. register tools); use a function-scoped bridge for that.
+    """
+    return ToolBridge(dummy_provider)
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """An event loop shared by every test that runs coroutines."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
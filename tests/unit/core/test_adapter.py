@@ -2,11 +2,10 @@
 Unit tests for the provider adapter interface.
 """
 
-import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from typing import Dict, Any, Optional, List
 
-import pytest
+from pydantic import ConfigDict
 
 from llm_toolbridge.core.provider import Provider, ProviderConfig, LLMResponse, ToolCall
 from llm_toolbridge.core.adapter import BaseProviderAdapter, ProviderCapabilities
@@ -29,6 +28,8 @@ class MockResponse:
 
 # Mock provider config
 class MockProviderConfig(ProviderConfig):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     api_key: str = "mock-api-key"
 
 
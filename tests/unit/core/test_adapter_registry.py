@@ -2,24 +2,14 @@
 Unit tests for the AdapterRegistry class in adapter_registry.py.
 """
 
+from unittest.mock import patch
+
 import pytest
 from llm_toolbridge.core.adapter_registry import AdapterRegistry
 from llm_toolbridge.core.adapter import BaseProviderAdapter
-from llm_toolbridge.core.provider import Provider, ProviderConfig
-
-
-class DummyProvider(Provider):
-    def __init__(self, config: ProviderConfig):
-        self.config = config
-
-    async def generate(self, prompt, tools=None, tool_results=None, **kwargs):
-        pass
-
-    def format_tools_for_provider(self, tools):
-        return []
-
-    def parse_tool_calls(self, raw_response):
-        return []
+from llm_toolbridge.core.provider import Provider
+from llm_toolbridge.providers import azure_openai
+from llm_toolbridge.providers.azure_openai import AzureOpenAIConfig, AzureOpenAIProvider
 
 
 class DummyAdapter(BaseProviderAdapter):
@@ -53,10 +43,13 @@ class DummyAdapter(BaseProviderAdapter):
 
 @pytest.fixture(autouse=True)
 def clear_registry():
-    # Clear registry before each test to avoid cross-test pollution
+    # Start each test from an empty registry, then restore whatever other
+    # modules had registered so the tests don't leak into or wipe shared state
+    saved = AdapterRegistry._registry.copy()
     AdapterRegistry._registry.clear()
     yield
     AdapterRegistry._registry.clear()
+    AdapterRegistry._registry.update(saved)
 
 
 def test_register_and_get_adapter_class():
@@ -84,24 +77,22 @@ def test_get_adapter_class_unregistered_provider():
         AdapterRegistry.get_adapter_class("not_registered")
 
 
-def test_create_adapter_expected_use():
+def test_create_adapter_expected_use(dummy_provider):
     """
     Test creating an adapter instance for a registered provider.
     """
     AdapterRegistry.register("dummy", DummyAdapter)
-    provider = DummyProvider(ProviderConfig())
-    adapter = AdapterRegistry.create_adapter("dummy", provider)
+    adapter = AdapterRegistry.create_adapter("dummy", dummy_provider)
     assert isinstance(adapter, DummyAdapter)
-    assert adapter.provider is provider
+    assert adapter.provider is dummy_provider
 
 
-def test_create_adapter_unregistered_provider():
+def test_create_adapter_unregistered_provider(dummy_provider):
     """
     Test creating an adapter for an unregistered provider raises KeyError.
     """
-    provider = DummyProvider(ProviderConfig())
     with pytest.raises(KeyError):
-        AdapterRegistry.create_adapter("not_registered", provider)
+        AdapterRegistry.create_adapter("not_registered", dummy_provider)
 
 
 def test_get_available_providers_edge_case():
@@ -112,3 +103,30 @@ def test_get_available_providers_edge_case():
     providers = AdapterRegistry.get_available_providers()
     assert "dummy" in providers
     assert providers["dummy"] is DummyAdapter
+
+
+def test_create_from_config_imports_installed_provider():
+    """
+    Test create_from_config imports the provider from the llm_toolbridge package.
+    """
+    config = AzureOpenAIConfig(
+        api_key="test-key",
+        endpoint="https://test-endpoint.openai.azure.com",
+        deployment_name="test-deployment",
+    )
+    AdapterRegistry.register("azure_openai", DummyAdapter)
+
+    with patch.object(azure_openai, "AzureOpenAI"):
+        adapter = AdapterRegistry.create_from_config("azure_openai", config)
+    azure_openai._CLIENT_CACHE.clear()
+
+    assert isinstance(adapter, DummyAdapter)
+    assert isinstance(adapter.provider, AzureOpenAIProvider)
+
+
+def test_create_from_config_unknown_provider(provider_config):
+    """
+    Test create_from_config raises ImportError for an unknown provider module.
+    """
+    with pytest.raises(ImportError):
+        AdapterRegistry.create_from_config("does_not_exist", provider_config)
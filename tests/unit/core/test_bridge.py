@@ -7,10 +7,18 @@ from llm_toolbridge.core.bridge import ToolBridge
 from llm_toolbridge.core.tool import Tool, ParameterDefinition
 from llm_toolbridge.core.provider import Provider, ProviderConfig, LLMResponse, ToolCall
 from llm_toolbridge.core.adapter import BaseProviderAdapter
-import asyncio
 
 
-class DummyProvider(Provider):
+class ScriptedProvider(Provider):
+    # Responses are built once and shared, since the bridge only reads them
+    _INITIAL = LLMResponse(
+        content=None,
+        tool_calls=[
+            ToolCall(tool_name="adder", arguments={"a": 1, "b": 2}, call_id="call1")
+        ],
+    )
+    _FINAL = LLMResponse(content="Result is 3", tool_calls=[])
+
     def __init__(self, config: ProviderConfig):
         self.config = config
         self._calls = []
@@ -18,17 +26,7 @@ class DummyProvider(Provider):
     async def generate(self, prompt, tools=None, tool_results=None, **kwargs):
         self._calls.append((prompt, tools, tool_results))
         # Simulate a tool call on first call, then return a final response
-        if not tool_results:
-            return LLMResponse(
-                content=None,
-                tool_calls=[
-                    ToolCall(
-                        tool_name="adder", arguments={"a": 1, "b": 2}, call_id="call1"
-                    )
-                ],
-            )
-        else:
-            return LLMResponse(content="Result is 3", tool_calls=[])
+        return self._FINAL if tool_results else self._INITIAL
 
     def format_tools_for_provider(self, tools):
         return []
@@ -70,7 +68,18 @@ class DummyAdapter(BaseProviderAdapter):
         return None
 
 
-def make_tool():
+@pytest.fixture
+def scripted_provider(provider_config):
+    """A provider that requests the adder tool once, then answers.
+
+    Function-scoped because it records its calls.
+    """
+    return ScriptedProvider(provider_config)
+
+
+@pytest.fixture(scope="module")
+def adder_tool():
+    """The adder tool, shared since tests only register it, never modify it."""
     return Tool(
         name="adder",
         description="Adds two numbers.",
@@ -82,35 +91,35 @@ def make_tool():
     )
 
 
-def test_register_and_get_tool():
+@pytest.fixture
+def bridge_with_adder(scripted_provider, adder_tool):
+    """A bridge over the scripted provider with the adder tool registered."""
+    bridge = ToolBridge(scripted_provider)
+    bridge.register_tool(adder_tool)
+    return bridge
+
+
+def test_register_and_get_tool(bridge_with_adder, adder_tool):
     """Test registering and retrieving a tool."""
-    bridge = ToolBridge(DummyProvider(ProviderConfig()))
-    tool = make_tool()
-    bridge.register_tool(tool)
-    assert bridge.get_tool("adder") is tool
+    assert bridge_with_adder.get_tool("adder") is adder_tool
 
 
-def test_register_duplicate_tool_raises():
+def test_register_duplicate_tool_raises(bridge_with_adder, adder_tool):
     """Test registering a tool with duplicate name raises ValueError."""
-    bridge = ToolBridge(DummyProvider(ProviderConfig()))
-    tool = make_tool()
-    bridge.register_tool(tool)
     with pytest.raises(ValueError):
-        bridge.register_tool(tool)
+        bridge_with_adder.register_tool(adder_tool)
 
 
-def test_get_tool_not_found():
+def test_get_tool_not_found(readonly_bridge):
     """Test getting a tool that is not registered raises KeyError."""
-    bridge = ToolBridge(DummyProvider(ProviderConfig()))
     with pytest.raises(KeyError):
-        bridge.get_tool("notfound")
+        readonly_bridge.get_tool("notfound")
 
 
-def test_register_tools_bulk():
+def test_register_tools_bulk(dummy_provider, adder_tool):
     """Test registering multiple tools at once."""
-    bridge = ToolBridge(DummyProvider(ProviderConfig()))
-    tool1 = make_tool()
-    tool2 = Tool(
+    bridge = ToolBridge(dummy_provider)
+    multiplier_tool = Tool(
         name="multiplier",
         description="Multiplies two numbers.",
         parameters={
@@ -119,51 +128,45 @@ def test_register_tools_bulk():
         },
         function=lambda a, b: a * b,
     )
-    bridge.register_tools([tool1, tool2])
-    assert bridge.get_tool("adder") is tool1
-    assert bridge.get_tool("multiplier") is tool2
+    bridge.register_tools([adder_tool, multiplier_tool])
+    assert bridge.get_tool("adder") is adder_tool
+    assert bridge.get_tool("multiplier") is multiplier_tool
 
 
-def test_resolve_tools_expected():
-    """Test _resolve_tools with names and objects."""
-    bridge = ToolBridge(DummyProvider(ProviderConfig()))
-    tool = make_tool()
-    bridge.register_tool(tool)
-    assert bridge._resolve_tools([tool]) == [tool]
-    assert bridge._resolve_tools(["adder"]) == [tool]
-    assert bridge._resolve_tools() == [tool]
+@pytest.mark.parametrize(
+    "make_tools",
+    [lambda tool: [tool], lambda tool: ["adder"], lambda tool: None],
+    ids=["objects", "names", "registered"],
+)
+def test_resolve_tools_expected(bridge_with_adder, adder_tool, make_tools):
+    """Test _resolve_tools with objects, names and no tools (all registered)."""
+    assert bridge_with_adder._resolve_tools(make_tools(adder_tool)) == [adder_tool]
 
 
-def test_resolve_tools_invalid_type():
+def test_resolve_tools_invalid_type(readonly_bridge):
     """Test _resolve_tools with invalid type raises TypeError."""
-    bridge = ToolBridge(DummyProvider(ProviderConfig()))
     with pytest.raises(TypeError):
-        bridge._resolve_tools([123])
+        readonly_bridge._resolve_tools([123])
 
 
-def test_execute_sync_with_adapter():
+def test_execute_sync_with_adapter(dummy_provider, adder_tool):
     """Test execute_sync uses adapter's execute_with_tools."""
-    adapter = DummyAdapter(DummyProvider(ProviderConfig()))
+    adapter = DummyAdapter(dummy_provider)
     bridge = ToolBridge(adapter)
-    tool = make_tool()
-    bridge.register_tool(tool)
-    resp = bridge.execute_sync("add 1 and 2", [tool])
+    bridge.register_tool(adder_tool)
+    resp = bridge.execute_sync("add 1 and 2", [adder_tool])
     assert resp.content == "Adapter response"
     assert adapter._calls[0][0] == "add 1 and 2"
 
 
-def test_execute_sync_with_provider_expected():
+def test_execute_sync_with_provider_expected(bridge_with_adder, adder_tool):
     """Test execute_sync with provider handles tool call loop and returns final response."""
-    provider = DummyProvider(ProviderConfig())
-    bridge = ToolBridge(provider)
-    tool = make_tool()
-    bridge.register_tool(tool)
-    resp = bridge.execute_sync("add 1 and 2", [tool])
+    resp = bridge_with_adder.execute_sync("add 1 and 2", [adder_tool])
     assert resp.content == "Result is 3"
     # The tool call result is not visible to the user, but the final content is.
 
 
-def test_execute_sync_with_provider_tool_error():
+def test_execute_sync_with_provider_tool_error(scripted_provider):
     """Test execute_sync with provider when tool raises error (failure case)."""
 
     def bad_tool(a, b):
@@ -178,8 +181,7 @@ def test_execute_sync_with_provider_tool_error():
         },
         function=bad_tool,
     )
-    provider = DummyProvider(ProviderConfig())
-    bridge = ToolBridge(provider)
+    bridge = ToolBridge(scripted_provider)
     bridge.register_tool(tool)
     resp = bridge.execute_sync("add 1 and 2", [tool])
     assert (
@@ -8,9 +8,10 @@ from llm_toolbridge.core.schema import ToolBridgeRequest, ToolResult, ToolBridge
 from llm_toolbridge.core.tool import Tool, ParameterDefinition
 
 
-def make_valid_tool() -> Tool:
+@pytest.fixture(scope="module")
+def valid_tool() -> Tool:
     """
-    Create a valid Tool instance for testing.
+    Create a valid Tool instance shared by the tests in this module.
 
     Returns:
         Tool: A valid Tool instance.
@@ -30,14 +31,13 @@ def make_valid_tool() -> Tool:
     )
 
 
-def test_tool_bridge_request_expected_use():
+def test_tool_bridge_request_expected_use(valid_tool):
     """
     Test ToolBridgeRequest with all fields provided.
     """
-    tool = make_valid_tool()
     req = ToolBridgeRequest(
         prompt="Test prompt",
-        tools=[tool],
+        tools=[valid_tool],
         model="gpt-4",
         temperature=0.7,
         max_tokens=100,
@@ -61,14 +61,6 @@ def test_tool_bridge_request_edge_case():
     assert req.max_tokens is None
 
 
-def test_tool_bridge_request_failure_case():
-    """
-    Test ToolBridgeRequest fails if prompt is missing.
-    """
-    with pytest.raises(ValidationError):
-        ToolBridgeRequest()
-
-
 def test_tool_result_expected_use():
     """
     Test ToolResult with all fields provided.
@@ -99,14 +91,6 @@ def test_tool_result_edge_case():
     assert result.success is True
 
 
-def test_tool_result_failure_case():
-    """
-    Test ToolResult fails if tool_name is missing.
-    """
-    with pytest.raises(ValidationError):
-        ToolResult()
-
-
 def test_tool_bridge_response_expected_use():
     """
     Test ToolBridgeResponse with all fields provided.
@@ -134,9 +118,15 @@ def test_tool_bridge_response_edge_case():
     assert resp.usage is None
 
 
-def test_tool_bridge_response_failure_case():
+@pytest.mark.parametrize(
+    "model",
+    [ToolBridgeRequest, ToolResult, ToolBridgeResponse],
+    ids=lambda model: model.__name__,
+)
+def test_required_field_missing(model):
     """
-    Test ToolBridgeResponse fails if provider_name is missing.
+    Test that each schema fails validation if its required field is missing
+    (prompt, tool_name and provider_name respectively).
     """
     with pytest.raises(ValidationError):
-        ToolBridgeResponse()
+        model()
@@ -0,0 +1,73 @@
+"""
+Unit tests for the session module.
+"""
+
+import json
+
+import pytest
+
+from llm_toolbridge.core.provider import ToolCall
+from llm_toolbridge.core.session import ChatSession
+
+
+def test_session_expected_use():
+    """Test building a conversation with a tool call round-trip."""
+    session = ChatSession()
+
+    session.add_user("What is 5 + 3?")
+    session.add_assistant(
+        tool_calls=[
+            ToolCall(tool_name="calculator", arguments={"x": 5, "y": 3}, call_id="1")
+        ]
+    )
+    session.add_tool_result("1", {"result": 8})
+    session.add_assistant("5 + 3 = 8")
+
+    messages = session.snapshot()
+
+    assert len(session) == 4
+    assert [m["role"] for m in messages] == ["user", "assistant", "tool", "assistant"]
+    assert messages[1]["tool_calls"][0]["function"]["name"] == "calculator"
+    assert json.loads(messages[1]["tool_calls"][0]["function"]["arguments"]) == {
+        "x": 5,
+        "y": 3,
+    }
+    assert messages[2]["tool_call_id"] == "1"
+    assert json.loads(messages[2]["content"]) == {"result": 8}
+    assert "tool_calls" not in messages[3]
+
+
+def test_session_snapshot_is_not_affected_by_later_turns():
+    """Test that a snapshot keeps the messages it was taken with."""
+    session = ChatSession()
+    session.add_user("Hello")
+
+    snapshot = session.snapshot()
+    session.add_assistant("Hi")
+
+    assert len(snapshot) == 1
+    assert len(session) == 2
+
+
+def test_session_rejects_unserializable_tool_result():
+    """Test that a tool result that is not JSON serializable fails when added."""
+    session = ChatSession()
+
+    with pytest.raises(TypeError):
+        session.add_tool_result("1", object())
+
+    assert len(session) == 0
+
+
+def test_session_extend_keeps_tool_result_ids():
+    """Test that a turn built separately can be added with its tool results."""
+    session = ChatSession()
+    session.add_user("Hello")
+
+    turn = ChatSession()
+    turn.add_tool_result("1", {"result": 8})
+    session.extend(turn)
+
+    assert [m["role"] for m in session.messages] == ["user", "tool"]
+    assert session.has_tool_result("1")
+    assert not session.has_tool_result("2")
@@ -3,11 +3,48 @@ Unit tests for the tool module.
 """
 
 import pytest
-from typing import Dict, Any
 
 from llm_toolbridge.core.tool import Tool, ParameterDefinition
 
 
+@pytest.fixture(scope="module")
+def schema_tool():
+    """
+    A tool mixing required, optional and enum parameters, given both as
+    ParameterDefinition objects and dicts, with its to_dict() output.
+
+    Returns:
+        Tuple of the Tool and its dictionary representation.
+    """
+    tool = Tool(
+        name="test_tool",
+        description="A test tool",
+        parameters={
+            "required_param": ParameterDefinition(
+                type="string", description="A required parameter", required=True
+            ),
+            "optional_param": {
+                "type": "integer",
+                "description": "An optional parameter",
+                "required": False,
+                "default": 0,
+            },
+            "verbose": ParameterDefinition(
+                type="boolean",
+                description="An optional parameter definition",
+                required=False,
+                default=False,
+            ),
+            "color": ParameterDefinition(
+                type="string",
+                description="Choose a color",
+                enum=["red", "green", "blue"],
+            ),
+        },
+    )
+    return tool, tool.to_dict()
+
+
 def test_parameter_definition_creation():
     """Test that parameter definitions are created correctly."""
     param = ParameterDefinition(
@@ -93,37 +130,6 @@ def test_tool_creation_with_dict_parameters():
     assert not tool.parameters["param2"].required  # Should be False
 
 
-def test_tool_to_dict():
-    """Test converting a tool to a dictionary format suitable for LLM providers."""
-    # Create a tool with mixed parameter types
-    tool = Tool(
-        name="test_tool",
-        description="A test tool",
-        parameters={
-            "param1": ParameterDefinition(
-                type="string", description="A string parameter"
-            ),
-            "param2": {
-                "type": "integer",
-                "description": "An integer parameter",
-                "required": False,
-                "default": 0,
-            },
-        },
-    )
-
-    tool_dict = tool.to_dict()
-
-    assert tool_dict["name"] == "test_tool"
-    assert tool_dict["description"] == "A test tool"
-    assert "properties" in tool_dict["parameters"]
-    assert "param1" in tool_dict["parameters"]["properties"]
-    assert "param2" in tool_dict["parameters"]["properties"]
-    assert "required" in tool_dict["parameters"]
-    assert "param1" in tool_dict["parameters"]["required"]
-    assert "param2" not in tool_dict["parameters"]["required"]
-
-
 def test_tool_invoke_success():
     """Test successfully invoking a tool with arguments."""
 
@@ -175,48 +181,39 @@ def test_tool_invoke_failure():
     )
 
     # Tool has no function, should raise ValueError
-    with pytest.raises(ValueError) as excinfo:
+    with pytest.raises(ValueError, match="has no associated function"):
         tool.invoke({"param1": "value"})
 
-    assert "has no associated function" in str(excinfo.value)
 
+def test_tool_to_dict(schema_tool):
+    """Test converting a tool to a dictionary format suitable for LLM providers."""
+    _, tool_dict = schema_tool
+
+    assert tool_dict["name"] == "test_tool"
+    assert tool_dict["description"] == "A test tool"
+    assert "properties" in tool_dict["parameters"]
+    assert "required_param" in tool_dict["parameters"]["properties"]
+    assert "optional_param" in tool_dict["parameters"]["properties"]
+    assert tool_dict["parameters"]["properties"]["verbose"] == {
+        "type": "boolean",
+        "description": "An optional parameter definition",
+        "default": False,
+    }
+    assert "required" in tool_dict["parameters"]
 
-def test_tool_missing_required_parameter():
-    """Test that required parameters are properly marked in the tool schema."""
-    tool = Tool(
-        name="test_tool",
-        description="A test tool",
-        parameters={
-            "required_param": ParameterDefinition(
-                type="string", description="A required parameter", required=True
-            ),
-            "optional_param": ParameterDefinition(
-                type="string", description="An optional parameter", required=False
-            ),
-        },
-    )
 
-    tool_dict = tool.to_dict()
+def test_tool_missing_required_parameter(schema_tool):
+    """Test that required parameters are properly marked in the tool schema."""
+    _, tool_dict = schema_tool
 
     assert "required_param" in tool_dict["parameters"]["required"]
     assert "optional_param" not in tool_dict["parameters"]["required"]
+    assert "verbose" not in tool_dict["parameters"]["required"]
 
 
-def test_enum_parameters():
+def test_enum_parameters(schema_tool):
     """Test that enum parameters are correctly represented in the tool schema."""
-    tool = Tool(
-        name="test_tool",
-        description="A test tool",
-        parameters={
-            "color": ParameterDefinition(
-                type="string",
-                description="Choose a color",
-                enum=["red", "green", "blue"],
-            )
-        },
-    )
-
-    tool_dict = tool.to_dict()
+    _, tool_dict = schema_tool
 
     assert "enum" in tool_dict["parameters"]["properties"]["color"]
     assert tool_dict["parameters"]["properties"]["color"]["enum"] == [
@@ -0,0 +1,213 @@
+"""
+Shared fixtures for the provider unit tests.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from llm_toolbridge.providers import azure_openai
+from llm_toolbridge.providers.azure_openai import AzureOpenAIProvider, AzureOpenAIConfig
+from llm_toolbridge.providers.openai import OpenAIProvider, OpenAIConfig
+
+
+def _make_tool_call(name: str, arguments: str, call_id: str) -> SimpleNamespace:
+    """Build a stand-in for a tool call of a chat completion message."""
+    return SimpleNamespace(
+        id=call_id,
+        type="function",
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+def _to_namespace(value):
+    """Recursively convert the dicts of a parsed JSON document to namespaces."""
+    if isinstance(value, dict):
+        return SimpleNamespace(**{k: _to_namespace(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return [_to_namespace(item) for item in value]
+    return value
+
+
+class _CaptureCreate:
+    """
+    Stand-in for chat.completions.create that records its last call.
+
+    Set return_value, or side_effect to an exception to raise or to an
+    iterable of responses to return one per call.
+    """
+
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+        self.calls = 0
+        self.kwargs = None
+
+    def __call__(self, **kwargs):
+        self.calls += 1
+        self.kwargs = kwargs
+
+        if isinstance(self.side_effect, BaseException):
+            raise self.side_effect
+        if self.side_effect is not None:
+            if not hasattr(self.side_effect, "__next__"):
+                self.side_effect = iter(self.side_effect)
+            return next(self.side_effect)
+        return self.return_value
+
+
+def _stub_client() -> SimpleNamespace:
+    """
+    Build a stand-in for an SDK client.
+
+    Only chat.completions.create exists, as a _CaptureCreate.
+    """
+    return SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=_CaptureCreate()))
+    )
+
+
+def _build_azure_provider(config: AzureOpenAIConfig) -> AzureOpenAIProvider:
+    """Build an Azure OpenAI provider whose client is a stub."""
+    with patch(
+        "llm_toolbridge.providers.azure_openai.AzureOpenAI",
+        return_value=_stub_client(),
+    ):
+        provider = AzureOpenAIProvider(config)
+
+    # Reason: don't hand this stub client to providers built later in a test
+    azure_openai._CLIENT_CACHE.clear()
+    return provider
+
+
+def _build_openai_provider(config: OpenAIConfig) -> OpenAIProvider:
+    """Build an OpenAI provider whose client is a stub."""
+    with patch("llm_toolbridge.providers.openai.OpenAI", return_value=_stub_client()):
+        return OpenAIProvider(config)
+
+
+@pytest.fixture(scope="session")
+def chat_completion_payload():
+    """The chat completion in fixtures/chat_completion.json, loaded once."""
+    path = Path(__file__).parent / "fixtures" / "chat_completion.json"
+    return json.loads(path.read_text())
+
+
+@pytest.fixture(scope="session")
+def make_response(chat_completion_payload):
+    """
+    Builder for chat completion responses with a single assistant choice.
+
+    The responses are plain namespaces built from chat_completion_payload
+    rather than MagicMocks, so only use them where nothing is asserted about
+    how they were accessed.
+    """
+
+    def build(content=None, tool_calls=()) -> SimpleNamespace:
+        response = _to_namespace(chat_completion_payload)
+        choice = response.choices[0]
+        choice.message.content = content
+        choice.message.tool_calls = list(tool_calls)
+        choice.finish_reason = "tool_calls" if tool_calls else "stop"
+        return response
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def make_tool_call():
+    """Builder for the tool calls passed to make_response."""
+    return _make_tool_call
+
+
+@pytest.fixture(scope="session")
+def azure_config():
+    """An Azure OpenAI configuration shared by every test."""
+    return AzureOpenAIConfig(
+        api_key="test-key",
+        endpoint="https://test-endpoint.openai.azure.com",
+        deployment_name="test-deployment",
+    )
+
+
+@pytest.fixture(scope="session")
+def openai_config():
+    """An OpenAI configuration shared by every test."""
+    return OpenAIConfig(api_key="test-key", model="gpt-4")
+
+
+@pytest.fixture(scope="module")
+def azure_provider(azure_config):
+    """
+    An Azure OpenAI provider shared by the tests of a module.
+
+    Only use it in tests that don't configure its stub client or rely on its
+    caches; use azure_provider_isolated for those. Its async client is built
+    for each event loop, so tests that run it under asyncio.run can share it.
+    """
+    return _build_azure_provider(azure_config)
+
+
+@pytest.fixture(scope="module")
+def openai_provider(openai_config):
+    """
+    An OpenAI provider shared by the tests of a module.
+
+    Only use it in tests that don't configure its stub client; use
+    openai_provider_isolated for those.
+    """
+    return _build_openai_provider(openai_config)
+
+
+@pytest.fixture
+def azure_provider_isolated(azure_config):
+    """An Azure OpenAI provider with its own stub client, available as .client."""
+    return _build_azure_provider(azure_config)
+
+
+@pytest.fixture
+def openai_provider_isolated(openai_config):
+    """An OpenAI provider with its own stub client, available as .client."""
+    return _build_openai_provider(openai_config)
+
+
+@pytest.fixture(scope="module")
+def patch_azure_clients():
+    """
+    Patch the sync and async Azure OpenAI clients once for a whole module.
+
+    The Azure OpenAI test modules use it, along with clear_client_cache, for
+    all of their tests through pytestmark.
+    """
+    with patch("llm_toolbridge.providers.azure_openai.AzureOpenAI") as sync_class:
+        with patch(
+            "llm_toolbridge.providers.azure_openai.AsyncAzureOpenAI"
+        ) as async_class:
+            yield sync_class, async_class
+
+
+@pytest.fixture
+def azure_mock_class(patch_azure_clients):
+    """The patched AzureOpenAI class, reset for each test."""
+    mock_class = patch_azure_clients[0]
+    mock_class.reset_mock(return_value=True, side_effect=True)
+    return mock_class
+
+
+@pytest.fixture
+def azure_async_mock_class(patch_azure_clients):
+    """The patched AsyncAzureOpenAI class, reset for each test."""
+    mock_class = patch_azure_clients[1]
+    mock_class.reset_mock(return_value=True, side_effect=True)
+    return mock_class
+
+
+@pytest.fixture
+def clear_client_cache():
+    """Clear cached clients so each test sees its own patched AzureOpenAI."""
+    azure_openai._CLIENT_CACHE.clear()
+    yield
+    azure_openai._CLIENT_CACHE.clear()
@@ -0,0 +1,199 @@
+"""
+Unit tests for the batch methods of the Azure OpenAI provider.
+"""
+
+import asyncio
+import json
+import re
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llm_toolbridge.providers.azure_openai import (
+    AzureOpenAIProvider,
+    AzureOpenAIError,
+)
+
+# Every test runs with the Azure OpenAI clients patched
+pytestmark = pytest.mark.usefixtures("patch_azure_clients", "clear_client_cache")
+
+# Output file of a batch with one successful and one failed request
+_BATCH_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "test-deployment",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "Hi there"},
+        }
+    ],
+}
+_BATCH_OUTPUT = "\n".join(
+    [
+        json.dumps(
+            {
+                "custom_id": "greeting",
+                "response": {"status_code": 200, "body": _BATCH_COMPLETION},
+            }
+        ),
+        json.dumps(
+            {
+                "custom_id": "1",
+                "response": {
+                    "status_code": 400,
+                    "body": {"error": {"message": "Bad request"}},
+                },
+            }
+        ),
+    ]
+)
+
+
+class TestAzureBatchMixin:
+    """Tests for AzureOpenAIProvider.generate_batch and batch jobs."""
+
+    def test_generate_batch(
+        self, azure_provider, azure_async_mock_class, make_response
+    ):
+        """Test that generate_batch sends one request per prompt, in order."""
+        provider = azure_provider
+
+        async def fake_create(**kwargs):
+            return make_response("Echo: " + kwargs["messages"][0]["content"])
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(side_effect=fake_create)
+        azure_async_mock_class.return_value = mock_async_client
+
+        responses = asyncio.run(provider.generate_batch(["one", "two", "three"]))
+
+        assert [r.content for r in responses] == [
+            "Echo: one",
+            "Echo: two",
+            "Echo: three",
+        ]
+        assert mock_async_client.chat.completions.create.await_count == 3
+
+    def test_generate_batch_respects_max_concurrency(
+        self, azure_config, azure_mock_class, azure_async_mock_class, make_response
+    ):
+        """Test that no more than max_concurrency requests are in flight."""
+        config = azure_config.model_copy(update={"max_concurrency": 2})
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return make_response("ok")
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = fake_create
+        azure_async_mock_class.return_value = mock_async_client
+
+        provider = AzureOpenAIProvider(config)
+        responses = asyncio.run(provider.generate_batch(["prompt"] * 6))
+
+        assert len(responses) == 6
+        assert peak == 2
+
+    def test_submit_batch(self, azure_provider, azure_async_mock_class):
+        """Test uploading requests as JSONL and creating a batch job."""
+        provider = azure_provider
+
+        mock_async_client = MagicMock()
+        mock_async_client.files.create = AsyncMock(return_value=MagicMock(id="file-1"))
+        mock_async_client.batches.create = AsyncMock(
+            return_value=MagicMock(id="batch-1")
+        )
+        azure_async_mock_class.return_value = mock_async_client
+
+        batch_id = asyncio.run(
+            provider.submit_batch(
+                [
+                    {"prompt": "Hello", "custom_id": "greeting"},
+                    {"prompt": "Goodbye", "temperature": 0.2},
+                ]
+            )
+        )
+
+        assert batch_id == "batch-1"
+
+        upload_kwargs = mock_async_client.files.create.call_args.kwargs
+        assert upload_kwargs["purpose"] == "batch"
+        lines = [json.loads(line) for line in upload_kwargs["file"][1].splitlines()]
+        assert [line["custom_id"] for line in lines] == ["greeting", "1"]
+        assert lines[0]["url"] == "/chat/completions"
+        assert lines[0]["body"]["model"] == "test-deployment"
+        assert lines[0]["body"]["messages"][0]["content"] == "Hello"
+        assert lines[1]["body"]["temperature"] == 0.2
+
+        mock_async_client.batches.create.assert_awaited_once_with(
+            input_file_id="file-1",
+            endpoint="/chat/completions",
+            completion_window="24h",
+        )
+
+    @pytest.mark.parametrize(
+        "requests,message",
+        [
+            (
+                [{"prompt": "Hello", "custom_id": "1"}, {"prompt": "Goodbye"}],
+                "Batch request 1 reuses the custom_id '1'",
+            ),
+            (
+                [{"prompt": "Hello"}, {"temperature": 0.2}],
+                "Batch request 1 has no prompt",
+            ),
+        ],
+        ids=["duplicate_custom_id", "missing_prompt"],
+    )
+    def test_submit_batch_invalid_requests(
+        self, requests, message, azure_provider, azure_async_mock_class
+    ):
+        """Test that invalid requests are rejected before anything is uploaded."""
+        mock_async_client = MagicMock()
+        mock_async_client.files.create = AsyncMock()
+        azure_async_mock_class.return_value = mock_async_client
+
+        with pytest.raises(AzureOpenAIError, match=re.escape(message)):
+            asyncio.run(azure_provider.submit_batch(requests))
+
+        mock_async_client.files.create.assert_not_awaited()
+
+    def test_fetch_batch_results(self, azure_provider, azure_async_mock_class):
+        """Test parsing batch output lines and handling unfinished batches."""
+        provider = azure_provider
+
+        mock_async_client = MagicMock()
+        mock_async_client.batches.retrieve = AsyncMock(
+            return_value=MagicMock(status="in_progress")
+        )
+        mock_async_client.files.content = AsyncMock(
+            return_value=MagicMock(text=_BATCH_OUTPUT)
+        )
+        azure_async_mock_class.return_value = mock_async_client
+
+        # Still running
+        assert asyncio.run(provider.fetch_batch_results("batch-1")) is None
+
+        mock_async_client.batches.retrieve.return_value = MagicMock(
+            status="completed", output_file_id="file-out", error_file_id=None
+        )
+        results = asyncio.run(provider.fetch_batch_results("batch-1"))
+
+        assert results["greeting"].content == "Hi there"
+        assert "Bad request" in results["1"].content
+        mock_async_client.files.content.assert_awaited_once_with("file-out")
+
+        # Terminal failure states raise
+        mock_async_client.batches.retrieve.return_value = MagicMock(status="expired")
+        with pytest.raises(AzureOpenAIError, match="expired"):
+            asyncio.run(provider.fetch_batch_results("batch-1"))
@@ -2,27 +2,190 @@
 Unit tests for the Azure OpenAI provider.
 """
 
+import asyncio
+import copy
 import json
-from unittest.mock import patch, MagicMock
+import re
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, AsyncMock, MagicMock
 
+import httpx
+import openai
 import pytest
+from openai.types.chat import ChatCompletion
+from pydantic import ValidationError
+
+from llm_toolbridge.core.bridge import ToolBridge
+from llm_toolbridge.core.session import ChatSession
+from llm_toolbridge.core.tool import Tool
+from llm_toolbridge.providers import azure_openai
+from llm_toolbridge.providers.azure_openai import (
+    AzureOpenAIProvider,
+    AzureOpenAIConfig,
+    AzureOpenAIError,
+)
+from llm_toolbridge.utils import serialization
+
+# Every test runs with the Azure OpenAI clients patched
+pytestmark = pytest.mark.usefixtures("patch_azure_clients", "clear_client_cache")
+
+# Chat completions URL of the test deployment, with any query string
+_AZURE_URL_RE = re.compile(
+    r"^https://test-endpoint\.openai\.azure\.com"
+    r"/openai/deployments/test-deployment/chat/completions(\?.*)?$"
+)
+
+# Canned response bodies, built once for the whole module. Tests must not
+# mutate them.
+_PLAIN_TEXT_COMPLETION = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "Hello!"},
+        }
+    ],
+}
+
+_ERROR_BODY = {"error": {"message": "nope"}}
+
+
+class _RecordingTransport:
+    """
+    httpx transport handler that answers every request with a canned response.
+
+    The requests it receives are recorded so tests can inspect what the SDK
+    actually sent.
+    """
+
+    def __init__(self):
+        self.status_code = 200
+        self.content = b""
+        self.requests = []
+
+    def reset(self, payload=None, status_code=200):
+        """Set the next responses and forget the recorded requests."""
+        # Reason: serialize the body once rather than for every request
+        self.content = json.dumps(payload).encode()
+        self.status_code = status_code
+        self.requests.clear()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(
+            self.status_code,
+            content=self.content,
+            headers={"content-type": "application/json"},
+        )
+
 
-from llm_toolbridge.core.tool import Tool, ParameterDefinition
-from llm_toolbridge.core.provider import LLMResponse, ToolCall
-from llm_toolbridge.providers.azure_openai import AzureOpenAIProvider, AzureOpenAIConfig
+@pytest.fixture(scope="module")
+def http_transport():
+    """The transport behind azure_http_provider's client, shared by the module."""
+    return _RecordingTransport()
+
+
+@pytest.fixture(scope="module")
+def azure_http_provider(azure_config, http_transport):
+    """
+    An Azure OpenAI provider whose real SDK client talks to http_transport.
+
+    Retries are disabled so that error responses are raised straight away.
+    """
+    client = openai.AzureOpenAI(
+        api_key=azure_config.api_key,
+        api_version=azure_config.api_version,
+        azure_endpoint=azure_config.endpoint,
+        max_retries=0,
+        http_client=httpx.Client(transport=httpx.MockTransport(http_transport)),
+    )
+
+    with patch(
+        "llm_toolbridge.providers.azure_openai.AzureOpenAI", return_value=client
+    ):
+        provider = AzureOpenAIProvider(azure_config)
+
+    azure_openai._CLIENT_CACHE.clear()
+    yield provider
+    client.close()
+
+
+@pytest.fixture(scope="module")
+def tool_call_payload(chat_completion_payload):
+    """chat_completion_payload answering with a calculator tool call."""
+    payload = copy.deepcopy(chat_completion_payload)
+    payload["choices"][0]["finish_reason"] = "tool_calls"
+    payload["choices"][0]["message"]["tool_calls"] = [
+        {
+            "id": "call_123",
+            "type": "function",
+            "function": {"name": "calculator", "arguments": '{"x": 5, "y": 3}'},
+        }
+    ]
+    return payload
+
+
+class TestAzureOpenAIProviderHTTP:
+    """Tests for AzureOpenAIProvider requests and responses on the wire."""
+
+    def test_generate_sync_with_tools(
+        self,
+        azure_http_provider,
+        http_transport,
+        tool_call_payload,
+        calculator_tool,
+    ):
+        """Test the request sent for a tool-enabled prompt and the typed response."""
+        http_transport.reset(tool_call_payload)
+
+        response = azure_http_provider._generate_sync(
+            "Calculate 5 + 3", [calculator_tool]
+        )
+
+        assert response.tool_calls[0].tool_name == "calculator"
+        assert response.tool_calls[0].arguments == {"x": 5, "y": 3}
+
+        (request,) = http_transport.requests
+        assert _AZURE_URL_RE.match(str(request.url))
+        assert request.url.params["api-version"] == "2023-12-01-preview"
+        assert request.headers["api-key"] == "test-key"
+
+        body = json.loads(request.content)
+        assert body["messages"] == [{"role": "user", "content": "Calculate 5 + 3"}]
+        assert body["tools"][0]["function"]["name"] == "calculator"
+
+    @pytest.mark.parametrize(
+        "status_code,message",
+        [
+            (429, "request failed (rate limited)"),
+            (401, "request failed (authentication error)"),
+            (500, "request failed: "),
+        ],
+        ids=["rate_limited", "unauthorized", "server_error"],
+    )
+    def test_generate_sync_error_status(
+        self, azure_http_provider, http_transport, status_code, message
+    ):
+        """Test that error responses are raised as AzureOpenAIError."""
+        http_transport.reset(_ERROR_BODY, status_code=status_code)
+
+        with pytest.raises(AzureOpenAIError, match=re.escape(message)):
+            azure_http_provider._generate_sync("Hello")
+
+        (request,) = http_transport.requests
+        assert _AZURE_URL_RE.match(str(request.url))
 
 
 class TestAzureOpenAIProvider:
     """Tests for the AzureOpenAIProvider class."""
 
-    @patch("llm_toolbridge.providers.azure_openai.AzureOpenAI")
-    def test_init(self, mock_azure_openai):
+    def test_init(self, azure_config, azure_mock_class):
         """Test initialization of the provider."""
-        config = AzureOpenAIConfig(
-            api_key="test-key",
-            endpoint="https://test-endpoint.openai.azure.com",
-            deployment_name="test-deployment",
-        )
+        config = azure_config
 
         provider = AzureOpenAIProvider(config)
 
@@ -30,285 +193,341 @@ class TestAzureOpenAIProvider:
         assert provider.deployment_name == "test-deployment"
 
         # Verify AzureOpenAI client was initialized correctly
-        mock_azure_openai.assert_called_once_with(
+        azure_mock_class.assert_called_once_with(
             api_key="test-key",
             api_version="2023-12-01-preview",
             azure_endpoint="https://test-endpoint.openai.azure.com",
             organization=None,
+            max_retries=4,
         )
 
-    def test_format_tools_for_provider(self):
-        """Test formatting tools for the Azure OpenAI API."""
-        config = AzureOpenAIConfig(
-            api_key="test-key",
-            endpoint="https://test-endpoint.openai.azure.com",
-            deployment_name="test-deployment",
-        )
+    def test_config_is_frozen_and_rejects_unknown_fields(self, azure_config):
+        """Test that the config can't be modified or given unknown options."""
+        config = azure_config
 
-        with patch("llm_toolbridge.providers.azure_openai.AzureOpenAI"):
-            provider = AzureOpenAIProvider(config)
-
-            # Create a test tool with ParameterDefinition
-            tool = Tool(
-                name="calculator",
-                description="Performs mathematical calculations",
-                parameters={
-                    "operation": ParameterDefinition(
-                        type="string",
-                        description="The operation to perform",
-                        enum=["add", "subtract", "multiply", "divide"],
-                    ),
-                    "x": ParameterDefinition(
-                        type="number", description="First operand"
-                    ),
-                    "y": ParameterDefinition(
-                        type="number", description="Second operand"
-                    ),
-                },
-            )
+        with pytest.raises(ValidationError):
+            config.api_key = "other-key"
 
-            # Create a test tool with dict parameters
-            tool_with_dict = Tool(
-                name="echo",
-                description="Echoes the input",
-                parameters={
-                    "message": {"type": "string", "description": "The message to echo"}
-                },
+        with pytest.raises(ValidationError):
+            AzureOpenAIConfig(
+                api_key="test-key",
+                endpoint="https://test-endpoint.openai.azure.com",
+                deployment_name="test-deployment",
+                api_verison="2024-02-01",
             )
 
-            formatted_tools = provider.format_tools_for_provider([tool, tool_with_dict])
-
-            assert len(formatted_tools) == 2
+    def test_init_reuses_client(self, azure_config, azure_mock_class):
+        """Test that providers with the same credentials share one client."""
+        config = azure_config
+        other_deployment = config.model_copy(
+            update={"deployment_name": "other-deployment"}
+        )
+        other_key = config.model_copy(update={"api_key": "other-key"})
 
-            # Check first tool
-            assert formatted_tools[0]["type"] == "function"
-            assert formatted_tools[0]["function"]["name"] == "calculator"
-            assert (
-                formatted_tools[0]["function"]["description"]
-                == "Performs mathematical calculations"
-            )
-            assert (
-                "operation"
-                in formatted_tools[0]["function"]["parameters"]["properties"]
-            )
-            assert formatted_tools[0]["function"]["parameters"]["properties"][
-                "operation"
-            ]["enum"] == ["add", "subtract", "multiply", "divide"]
-            assert "x" in formatted_tools[0]["function"]["parameters"]["properties"]
-            assert "y" in formatted_tools[0]["function"]["parameters"]["properties"]
-            assert (
-                "operation" in formatted_tools[0]["function"]["parameters"]["required"]
-            )
-            assert "x" in formatted_tools[0]["function"]["parameters"]["required"]
-            assert "y" in formatted_tools[0]["function"]["parameters"]["required"]
-
-            # Check second tool with dict parameters
-            assert formatted_tools[1]["type"] == "function"
-            assert formatted_tools[1]["function"]["name"] == "echo"
-            assert (
-                "message" in formatted_tools[1]["function"]["parameters"]["properties"]
-            )
-            assert "message" in formatted_tools[1]["function"]["parameters"]["required"]
+        azure_mock_class.side_effect = lambda **kwargs: MagicMock()
 
-    def test_parse_tool_calls(self):
-        """Test parsing tool calls from Azure OpenAI API response."""
-        config = AzureOpenAIConfig(
-            api_key="test-key",
-            endpoint="https://test-endpoint.openai.azure.com",
-            deployment_name="test-deployment",
-        )
+        provider = AzureOpenAIProvider(config)
 
-        with patch("llm_toolbridge.providers.azure_openai.AzureOpenAI"):
-            provider = AzureOpenAIProvider(config)
+        assert AzureOpenAIProvider(other_deployment).client is provider.client
+        assert AzureOpenAIProvider(other_key).client is not provider.client
+        assert azure_mock_class.call_count == 2
 
-            # Create a mock OpenAI API response with tool calls
-            mock_response = MagicMock()
+    def test_parse_response_plain_text(self, azure_provider, caplog):
+        """Test a typed text-only response, where message.tool_calls is None."""
+        response = ChatCompletion.model_validate(_PLAIN_TEXT_COMPLETION)
 
-            # Mocking the nested structure without relying on specific imports
-            mock_function = MagicMock()
-            mock_function.name = "calculator"
-            mock_function.arguments = '{"operation": "add", "x": 5, "y": 3}'
+        with caplog.at_level("ERROR"), patch.object(
+            azure_provider, "parse_tool_calls", wraps=azure_provider.parse_tool_calls
+        ) as parse_tool_calls:
+            parsed = azure_provider._parse_response(response)
 
-            mock_tool_call = MagicMock()
-            mock_tool_call.id = "call_123"
-            mock_tool_call.type = "function"
-            mock_tool_call.function = mock_function
+        assert parsed.content == "Hello!"
+        assert parsed.tool_calls == []
+        assert not caplog.records
+        # Text-only responses skip tool call parsing entirely
+        parse_tool_calls.assert_not_called()
 
-            mock_message = MagicMock()
-            mock_message.role = "assistant"
-            mock_message.content = None
-            mock_message.tool_calls = [mock_tool_call]
+    def test_generate_sync_default_params(self, azure_provider_isolated, make_response):
+        """Test the default generation parameters and per-call overrides."""
+        provider = azure_provider_isolated
 
-            mock_choice = MagicMock()
-            mock_choice.index = 0
-            mock_choice.message = mock_message
-            mock_choice.finish_reason = "tool_calls"
+        mock_client = provider.client
+        mock_client.chat.completions.create.return_value = make_response(
+            "Hello, I'm an AI assistant."
+        )
 
-            mock_response.choices = [mock_choice]
+        provider._generate_sync("Hello, how are you?")
+
+        kwargs = mock_client.chat.completions.create.kwargs
+        assert kwargs["temperature"] == 0.7
+        assert kwargs["max_tokens"] == 800
+        assert kwargs["top_p"] == 1.0
+        assert "tool_choice" not in kwargs
+
+        # Explicit parameters override the defaults for that call only
+        provider._generate_sync("Hello again", temperature=0.2, max_tokens=50)
+        kwargs = mock_client.chat.completions.create.kwargs
+        assert kwargs["temperature"] == 0.2
+        assert kwargs["max_tokens"] == 50
+        assert kwargs["top_p"] == 1.0
+        assert provider._base_params["temperature"] == 0.7
+
+    def test_generate_sync_with_session(
+        self, azure_provider_isolated, make_response, make_tool_call
+    ):
+        """Test that a session accumulates the turns of a tool call round-trip."""
+        provider = azure_provider_isolated
+
+        mock_client = provider.client
+        mock_client.chat.completions.create.side_effect = [
+            make_response(
+                tool_calls=[
+                    make_tool_call("calculator", '{"x": 5, "y": 3}', "call_123")
+                ]
+            ),
+            make_response("5 + 3 = 8"),
+        ]
+
+        session = ChatSession()
+
+        provider._generate_sync("Calculate 5 + 3", session=session)
+        response = provider._generate_sync(
+            "Calculate 5 + 3", tool_results={"call_123": 8}, session=session
+        )
 
-            tool_calls = provider.parse_tool_calls(mock_response)
+        assert response.content == "5 + 3 = 8"
+        assert [m["role"] for m in session.messages] == [
+            "user",
+            "assistant",
+            "tool",
+            "assistant",
+        ]
+
+        # The second request carries the history, not a rebuilt single turn
+        kwargs = mock_client.chat.completions.create.kwargs
+        assert [m["role"] for m in kwargs["messages"]] == ["user", "assistant", "tool"]
+        assert kwargs["messages"][1]["tool_calls"][0]["id"] == "call_123"
+        assert "session" not in kwargs
+
+    def test_execute_sync_with_session_across_tool_rounds(
+        self,
+        azure_provider_isolated,
+        azure_async_mock_class,
+        make_response,
+        make_tool_call,
+    ):
+        """Test that each tool result is added to the session exactly once."""
+        add = Tool(
+            name="add",
+            description="Adds two numbers",
+            parameters={
+                "x": {"type": "number", "description": "First operand"},
+                "y": {"type": "number", "description": "Second operand"},
+            },
+            function=lambda x, y: x + y,
+        )
+        bridge = ToolBridge(azure_provider_isolated)
+        bridge.register_tool(add)
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(
+            side_effect=[
+                make_response(
+                    tool_calls=[make_tool_call("add", '{"x": 5, "y": 3}', "call_1")]
+                ),
+                make_response(
+                    tool_calls=[make_tool_call("add", '{"x": 8, "y": 2}', "call_2")]
+                ),
+                make_response("The total is 10."),
+            ]
+        )
+        azure_async_mock_class.return_value = mock_async_client
+
+        session = ChatSession()
+        response = bridge.execute_sync("Add 5 and 3, then 2", session=session)
+
+        def tool_call_message(call_id, arguments):
+            return {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {
+                            "name": "add",
+                            "arguments": serialization.dumps(arguments),
+                        },
+                    }
+                ],
+            }
 
-            assert len(tool_calls) == 1
-            assert tool_calls[0].tool_name == "calculator"
-            assert tool_calls[0].call_id == "call_123"
-            assert tool_calls[0].arguments == {"operation": "add", "x": 5, "y": 3}
+        assert response.content == "The total is 10."
+        assert session.messages == [
+            {"role": "user", "content": "Add 5 and 3, then 2"},
+            tool_call_message("call_1", {"x": 5, "y": 3}),
+            {"role": "tool", "tool_call_id": "call_1", "content": "8"},
+            tool_call_message("call_2", {"x": 8, "y": 2}),
+            {"role": "tool", "tool_call_id": "call_2", "content": "10"},
+            {"role": "assistant", "content": "The total is 10."},
+        ]
+
+        # The last request sent the same history, without the final answer
+        kwargs = mock_async_client.chat.completions.create.call_args.kwargs
+        assert kwargs["messages"] == session.messages[:-1]
+
+    def test_execute_sync_reuses_async_client(
+        self, azure_provider_isolated, azure_async_mock_class, make_response
+    ):
+        """Test that repeated execute_sync calls share one async client."""
+        bridge = ToolBridge(azure_provider_isolated)
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(
+            return_value=make_response("Hi")
+        )
+        azure_async_mock_class.return_value = mock_async_client
 
-            # Test with invalid JSON in arguments
-            mock_invalid_function = MagicMock()
-            mock_invalid_function.name = "calculator"
-            mock_invalid_function.arguments = "{invalid_json}"
+        for _ in range(5):
+            assert bridge.execute_sync("Hello").content == "Hi"
 
-            mock_invalid_tool_call = MagicMock()
-            mock_invalid_tool_call.id = "call_456"
-            mock_invalid_tool_call.type = "function"
-            mock_invalid_tool_call.function = mock_invalid_function
+        assert mock_async_client.chat.completions.create.await_count == 5
+        azure_async_mock_class.assert_called_once()
 
-            mock_invalid_message = MagicMock()
-            mock_invalid_message.role = "assistant"
-            mock_invalid_message.content = None
-            mock_invalid_message.tool_calls = [mock_invalid_tool_call]
+    def test_execute_sync_from_two_threads_keeps_a_client_per_thread(
+        self, azure_provider_isolated, azure_async_mock_class, make_response
+    ):
+        """Test that threads alternating on one bridge don't rebuild clients."""
+        bridge = ToolBridge(azure_provider_isolated)
 
-            mock_invalid_choice = MagicMock()
-            mock_invalid_choice.index = 0
-            mock_invalid_choice.message = mock_invalid_message
-            mock_invalid_choice.finish_reason = "tool_calls"
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(
+            return_value=make_response("Hi")
+        )
+        azure_async_mock_class.return_value = mock_async_client
+
+        # One worker thread each, so each keeps its execute_sync loop
+        with ThreadPoolExecutor(1) as first, ThreadPoolExecutor(1) as second:
+            for _ in range(5):
+                for worker in (first, second):
+                    response = worker.submit(bridge.execute_sync, "Hello").result()
+                    assert response.content == "Hi"
+
+        assert mock_async_client.chat.completions.create.await_count == 10
+        assert azure_async_mock_class.call_count == 2
+
+    def test_generate_keeps_max_concurrency_while_another_loop_runs(
+        self, azure_config, azure_mock_class, azure_async_mock_class, make_response
+    ):
+        """Test that a request on another loop doesn't reset this loop's slots."""
+        provider = AzureOpenAIProvider(
+            azure_config.model_copy(update={"max_concurrency": 1})
+        )
+        main_loop = release = None
+        in_flight = 0
+        peak = 0
+
+        async def fake_create(**kwargs):
+            nonlocal in_flight, peak
+            if asyncio.get_running_loop() is not main_loop:
+                return make_response("other loop")
+
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+            return make_response("ok")
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = fake_create
+        azure_async_mock_class.return_value = mock_async_client
+
+        async def main():
+            nonlocal main_loop, release
+            main_loop = asyncio.get_running_loop()
+            release = asyncio.Event()
+
+            first = asyncio.ensure_future(provider.generate("one"))
+            await asyncio.sleep(0)
+
+            # Another thread runs a request on its own loop meanwhile
+            other = await main_loop.run_in_executor(
+                None, asyncio.run, provider.generate("other")
+            )
 
-            mock_invalid_response = MagicMock()
-            mock_invalid_response.choices = [mock_invalid_choice]
+            second = asyncio.ensure_future(provider.generate("two"))
+            await asyncio.sleep(0.01)
+            release.set()
+            return [other] + list(await asyncio.gather(first, second))
 
-            tool_calls_invalid = provider.parse_tool_calls(mock_invalid_response)
-            assert len(tool_calls_invalid) == 1
-            assert tool_calls_invalid[0].arguments == {
-                "error": "Invalid JSON in arguments"
-            }
+        responses = asyncio.run(main())
 
-    @patch("llm_toolbridge.providers.azure_openai.AzureOpenAI")
-    def test_generate_sync_success(self, mock_azure_openai_class):
-        """Test successful synchronous generation."""
-        config = AzureOpenAIConfig(
-            api_key="test-key",
-            endpoint="https://test-endpoint.openai.azure.com",
-            deployment_name="test-deployment",
-        )
+        assert [r.content for r in responses] == ["other loop", "ok", "ok"]
+        assert peak == 1
+        assert azure_async_mock_class.call_count == 2
 
-        # Create a mock response using MagicMock
-        mock_message = MagicMock()
-        mock_message.role = "assistant"
-        mock_message.content = "Hello, I'm an AI assistant."
-        mock_message.tool_calls = []
+    def test_generate_sync_failure_leaves_session_unchanged(
+        self, azure_provider_isolated, make_response
+    ):
+        """Test that the prompt of a failed request is not kept in the session."""
+        provider = azure_provider_isolated
 
-        mock_choice = MagicMock()
-        mock_choice.index = 0
-        mock_choice.message = mock_message
-        mock_choice.finish_reason = "stop"
+        mock_client = provider.client
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
 
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
+        session = ChatSession()
 
-        # Set up the mock client
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_azure_openai_class.return_value = mock_client
+        with pytest.raises(AzureOpenAIError):
+            provider._generate_sync("Hello", session=session)
 
-        provider = AzureOpenAIProvider(config)
-        response = provider._generate_sync("Hello, how are you?")
-
-        # Verify the response
-        assert response.content == "Hello, I'm an AI assistant."
-        assert not response.tool_calls
-
-        # Verify the request
-        mock_client.chat.completions.create.assert_called_once()
-        args, kwargs = mock_client.chat.completions.create.call_args
-        assert kwargs["model"] == "test-deployment"
-        assert kwargs["messages"][0]["content"] == "Hello, how are you?"
-
-    @patch("llm_toolbridge.providers.azure_openai.AzureOpenAI")
-    def test_generate_sync_with_tools(self, mock_azure_openai_class):
-        """Test generation with tools."""
-        config = AzureOpenAIConfig(
-            api_key="test-key",
-            endpoint="https://test-endpoint.openai.azure.com",
-            deployment_name="test-deployment",
-        )
+        assert session.messages == []
 
-        # Create a test tool
-        tool = Tool(
-            name="calculator",
-            description="Performs mathematical calculations",
-            parameters={
-                "operation": ParameterDefinition(
-                    type="string",
-                    description="The operation to perform",
-                    enum=["add", "subtract", "multiply", "divide"],
-                ),
-                "x": ParameterDefinition(type="number", description="First operand"),
-                "y": ParameterDefinition(type="number", description="Second operand"),
-            },
-        )
+        # Retrying sends the prompt once
+        mock_client.chat.completions.create.side_effect = None
+        mock_client.chat.completions.create.return_value = make_response("Hi")
+        provider._generate_sync("Hello", session=session)
 
-        # Create a mock response using MagicMock
-        mock_function = MagicMock()
-        mock_function.name = "calculator"
-        mock_function.arguments = '{"operation": "add", "x": 5, "y": 3}'
+        assert session.messages == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi"},
+        ]
 
-        mock_tool_call = MagicMock()
-        mock_tool_call.id = "call_123"
-        mock_tool_call.type = "function"
-        mock_tool_call.function = mock_function
+    def test_generate_sync_error_keeps_cause(self, azure_provider_isolated):
+        """Test that AzureOpenAIError is chained to the underlying error."""
+        provider = azure_provider_isolated
 
-        mock_message = MagicMock()
-        mock_message.role = "assistant"
-        mock_message.content = None
-        mock_message.tool_calls = [mock_tool_call]
+        mock_client = provider.client
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
 
-        mock_choice = MagicMock()
-        mock_choice.index = 0
-        mock_choice.message = mock_message
-        mock_choice.finish_reason = "tool_calls"
+        with pytest.raises(AzureOpenAIError) as excinfo:
+            provider._generate_sync("Hello")
 
-        mock_response = MagicMock()
-        mock_response.choices = [mock_choice]
+        assert isinstance(excinfo.value.__cause__, Exception)
 
-        # Set up the mock client
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.return_value = mock_response
-        mock_azure_openai_class.return_value = mock_client
+    def test_generate_async(
+        self, azure_provider, azure_async_mock_class, make_response
+    ):
+        """Test that generate awaits the async client instead of the sync one."""
+        provider = azure_provider
 
-        provider = AzureOpenAIProvider(config)
-        response = provider._generate_sync("Calculate 5 + 3", [tool])
+        mock_response = make_response("Hello from async.")
 
-        # Verify the response
-        assert response.content is None
-        assert len(response.tool_calls) == 1
-        assert response.tool_calls[0].tool_name == "calculator"
-        assert response.tool_calls[0].arguments == {"operation": "add", "x": 5, "y": 3}
-
-        # Verify request contains tools
-        mock_client.chat.completions.create.assert_called_once()
-        args, kwargs = mock_client.chat.completions.create.call_args
-        assert "tools" in kwargs
-        assert len(kwargs["tools"]) == 1
-        assert kwargs["tools"][0]["function"]["name"] == "calculator"
-
-    @patch("llm_toolbridge.providers.azure_openai.AzureOpenAI")
-    def test_generate_sync_error_handling(self, mock_azure_openai_class):
-        """Test error handling in generate_sync."""
-        config = AzureOpenAIConfig(
-            api_key="test-key",
-            endpoint="https://test-endpoint.openai.azure.com",
-            deployment_name="test-deployment",
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(
+            return_value=mock_response
         )
+        azure_async_mock_class.return_value = mock_async_client
 
-        # Set up the mock client to raise an exception
-        mock_client = MagicMock()
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
-        mock_azure_openai_class.return_value = mock_client
+        response = asyncio.run(provider.generate("Hello"))
 
-        provider = AzureOpenAIProvider(config)
+        assert response.content == "Hello from async."
+        mock_async_client.chat.completions.create.assert_awaited_once()
+        assert provider.client.chat.completions.create.calls == 0
 
-        # Test that the exception is properly caught and re-raised
-        with pytest.raises(Exception) as excinfo:
-            provider._generate_sync("Hello")
+        # A new event loop gets its own client
+        asyncio.run(provider.generate("Hello again"))
+        assert azure_async_mock_class.call_count == 2
+        assert azure_async_mock_class.call_args.kwargs["max_retries"] == 4
 
-        assert "API request failed" in str(excinfo.value)
+        # The states of closed loops don't pile up
+        assert len(provider._async_state) <= 1
@@ -0,0 +1,202 @@
+"""
+Unit tests for the streaming method of the Azure OpenAI provider.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from llm_toolbridge.core.session import ChatSession
+from llm_toolbridge.providers.azure_openai import AzureOpenAIProvider
+
+# Every test runs with the Azure OpenAI clients patched
+pytestmark = pytest.mark.usefixtures("patch_azure_clients", "clear_client_cache")
+
+
+class _FakeStream:
+    """Stand-in for the SDK's AsyncStream, yielding the given chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    async def close(self):
+        self.closed = True
+
+
+def _text_chunk(content):
+    """Build a stream chunk holding a text delta."""
+    chunk = MagicMock()
+    chunk.choices = [MagicMock()]
+    chunk.choices[0].delta.content = content
+    chunk.choices[0].delta.tool_calls = None
+    return chunk
+
+
+class TestAzureStreamMixin:
+    """Tests for AzureOpenAIProvider.stream_generate."""
+
+    def test_stream_generate(self, azure_provider, azure_async_mock_class):
+        """Test streaming text deltas and tool calls split across chunks."""
+        provider = azure_provider
+
+        def make_chunk(content=None, tool_calls=None):
+            delta = MagicMock()
+            delta.content = content
+            delta.tool_calls = tool_calls
+
+            choice = MagicMock()
+            choice.delta = delta
+
+            chunk = MagicMock()
+            chunk.choices = [choice]
+            return chunk
+
+        def make_call_delta(index, call_id=None, name=None, arguments=None):
+            function = MagicMock()
+            function.name = name
+            function.arguments = arguments
+
+            call_delta = MagicMock()
+            call_delta.index = index
+            call_delta.id = call_id
+            call_delta.function = function
+            return call_delta
+
+        # Azure starts the stream with a content filter chunk without choices
+        filter_chunk = MagicMock()
+        filter_chunk.choices = []
+
+        chunks = [
+            filter_chunk,
+            make_chunk(content="Let me "),
+            make_chunk(content="calculate."),
+            make_chunk(
+                tool_calls=[
+                    make_call_delta(0, "call_123", "calculator", '{"operation": ')
+                ]
+            ),
+            make_chunk(
+                tool_calls=[make_call_delta(0, arguments='"add", "x": 5, "y": 3}')]
+            ),
+        ]
+
+        stream = _FakeStream(chunks)
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(return_value=stream)
+        azure_async_mock_class.return_value = mock_async_client
+
+        async def collect():
+            return [r async for r in provider.stream_generate("Calculate 5 + 3")]
+
+        responses = asyncio.run(collect())
+
+        assert [r.content for r in responses[:2]] == ["Let me ", "calculate."]
+        assert responses[-1].content is None
+        assert len(responses[-1].tool_calls) == 1
+        assert responses[-1].tool_calls[0].tool_name == "calculator"
+        assert responses[-1].tool_calls[0].call_id == "call_123"
+        assert responses[-1].tool_calls[0].arguments == {
+            "operation": "add",
+            "x": 5,
+            "y": 3,
+        }
+
+        args, kwargs = mock_async_client.chat.completions.create.call_args
+        assert kwargs["stream"] is True
+        assert stream.closed
+
+    def test_stream_generate_with_session(self, azure_provider, azure_async_mock_class):
+        """Test that a streamed reply is added to the session once it ends."""
+        provider = azure_provider
+
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(
+            return_value=_FakeStream([_text_chunk("Hi "), _text_chunk("there")])
+        )
+        azure_async_mock_class.return_value = mock_async_client
+
+        session = ChatSession()
+
+        async def collect():
+            return [r async for r in provider.stream_generate("Hello", session=session)]
+
+        asyncio.run(collect())
+
+        assert session.messages == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi there"},
+        ]
+
+    def test_stream_generate_stopped_early_releases_slot(
+        self, azure_config, azure_mock_class, azure_async_mock_class
+    ):
+        """Test that closing a stream the consumer stopped reading frees its slot."""
+        provider = AzureOpenAIProvider(
+            azure_config.model_copy(update={"max_concurrency": 1})
+        )
+
+        stream = _FakeStream([_text_chunk("Hi "), _text_chunk("there")])
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(return_value=stream)
+        azure_async_mock_class.return_value = mock_async_client
+
+        async def read_first():
+            responses = provider.stream_generate("Hello")
+            async for response in responses:
+                break
+
+            # The consumer still holds the generator, and with it the slot of
+            # the loop the stream runs on
+            _, semaphore = provider._async_state[asyncio.get_running_loop()]
+            assert semaphore.locked()
+            assert not stream.closed
+
+            await responses.aclose()
+            assert not semaphore.locked()
+            return response
+
+        assert asyncio.run(read_first()).content == "Hi "
+        assert stream.closed
+
+    def test_stream_generate_keeps_its_slot_while_another_loop_runs(
+        self, azure_config, azure_mock_class, azure_async_mock_class, make_response
+    ):
+        """Test that a request on another loop neither waits for nor frees the slot."""
+        provider = AzureOpenAIProvider(
+            azure_config.model_copy(update={"max_concurrency": 1})
+        )
+
+        stream = _FakeStream([_text_chunk("Hi "), _text_chunk("there")])
+        mock_async_client = MagicMock()
+        mock_async_client.chat.completions.create = AsyncMock(return_value=stream)
+        azure_async_mock_class.return_value = mock_async_client
+
+        async def read_with_other_loop():
+            loop = asyncio.get_running_loop()
+            responses = provider.stream_generate("Hello")
+            first = await responses.__anext__()
+            _, semaphore = provider._async_state[loop]
+
+            # Another thread sends a request on its own loop meanwhile
+            mock_async_client.chat.completions.create = AsyncMock(
+                return_value=make_response("other loop")
+            )
+            other = await loop.run_in_executor(
+                None, asyncio.run, provider.generate("Hello")
+            )
+            assert provider._async_state[loop][1] is semaphore
+            assert semaphore.locked()
+
+            rest = [response async for response in responses]
+            assert not semaphore.locked()
+            return [first.content, other.content] + [r.content for r in rest]
+
+        assert asyncio.run(read_with_other_loop()) == ["Hi ", "other loop", "there"]
+        assert stream.closed
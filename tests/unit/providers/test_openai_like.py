@@ -0,0 +1,334 @@
+"""
+Unit tests shared by the providers built on the OpenAI chat completions API.
+
+Each test runs once per provider. Tests that depend on how a provider is
+configured or built live in the provider's own test module.
+"""
+
+import json
+from typing import NamedTuple, Optional, Type
+
+import httpx
+import pytest
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AuthenticationError,
+    RateLimitError,
+)
+from openai.types.chat import ChatCompletion
+
+from llm_toolbridge.core.tool import Tool
+from llm_toolbridge.providers.azure_openai import AzureOpenAIError
+from llm_toolbridge.providers.openai import OpenAIError
+from llm_toolbridge.utils import serialization
+
+
+class ProviderSpec(NamedTuple):
+    """What the shared tests need to know about a provider."""
+
+    provider_fixture: str
+    isolated_fixture: str
+    model: str
+    error: Type[Exception]
+
+
+_SPECS = {
+    "azure_openai": ProviderSpec(
+        provider_fixture="azure_provider",
+        isolated_fixture="azure_provider_isolated",
+        model="test-deployment",
+        error=AzureOpenAIError,
+    ),
+    "openai": ProviderSpec(
+        provider_fixture="openai_provider",
+        isolated_fixture="openai_provider_isolated",
+        model="gpt-4",
+        error=OpenAIError,
+    ),
+}
+
+
+# Arguments of the calculator tool calls in the responses below
+CALCULATOR_ARGS = {"operation": "add", "x": 5, "y": 3}
+CALCULATOR_ARGS_JSON = json.dumps(CALCULATOR_ARGS)
+
+# What the calculator_tool fixture and the echo tool below are formatted into
+EXPECTED_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "calculator",
+            "description": "Performs mathematical calculations",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "operation": {
+                        "type": "string",
+                        "description": "The operation to perform",
+                        "enum": ["add", "subtract", "multiply", "divide"],
+                    },
+                    "x": {"type": "number", "description": "First operand"},
+                    "y": {"type": "number", "description": "Second operand"},
+                },
+                "required": ["operation", "x", "y"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "echo",
+            "description": "Echoes the input",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "message": {"type": "string", "description": "The message to echo"}
+                },
+                "required": ["message"],
+                "additionalProperties": False,
+            },
+        },
+    },
+]
+
+
+@pytest.fixture(params=list(_SPECS))
+def provider_spec(request):
+    """The spec of each provider under test."""
+    return _SPECS[request.param]
+
+
+@pytest.fixture
+def provider(request, provider_spec):
+    """The provider's module-scoped instance, for tests that only read it."""
+    return request.getfixturevalue(provider_spec.provider_fixture)
+
+
+@pytest.fixture
+def provider_isolated(request, provider_spec):
+    """A provider with its own stub client, available as .client."""
+    return request.getfixturevalue(provider_spec.isolated_fixture)
+
+
+def test_chat_completion_fixture_matches_sdk(chat_completion_payload):
+    """Test that the response fixture file is a valid ChatCompletion."""
+    ChatCompletion.model_validate(chat_completion_payload)
+
+
+def test_format_tools_for_provider(provider, calculator_tool):
+    """Test formatting tools for the chat completions API."""
+    # Create a test tool with dict parameters
+    tool_with_dict = Tool(
+        name="echo",
+        description="Echoes the input",
+        parameters={
+            "message": {"type": "string", "description": "The message to echo"}
+        },
+    )
+
+    formatted_tools = provider.format_tools_for_provider(
+        [calculator_tool, tool_with_dict]
+    )
+
+    assert formatted_tools == EXPECTED_TOOLS
+
+
+def test_format_tools_for_provider_reuses_cached_dict(provider_isolated):
+    """Test that a Tool is only converted once, whatever toolset it is in."""
+    tool = Tool(
+        name="echo",
+        description="Echoes the input",
+        parameters={
+            "message": {"type": "string", "description": "The message to echo"}
+        },
+    )
+    noop = Tool(name="noop", description="Does nothing", parameters={})
+
+    first = provider_isolated.format_tools_for_provider([tool])
+    second = provider_isolated.format_tools_for_provider([noop, tool])
+
+    assert first[0] is second[1]
+
+
+def test_format_tools_for_provider_after_tool_is_modified(provider_isolated, provider):
+    """Test that changes made to a Tool after it was formatted are sent."""
+    tool = Tool(name="echo", description="Echoes the input", parameters={})
+    provider_isolated.format_tools_for_provider([tool])
+
+    tool.description = "Repeats the input"
+
+    # Both the provider that formatted the tool and another one see the change
+    for each in (provider_isolated, provider):
+        formatted = each.format_tools_for_provider([tool])
+        assert formatted[0]["function"]["description"] == "Repeats the input"
+
+
+def test_format_tools_for_provider_reuses_cached_list(provider_isolated):
+    """Test that the same toolset is formatted into the same list object."""
+    echo = Tool(name="echo", description="Echoes the input", parameters={})
+    noop = Tool(name="noop", description="Does nothing", parameters={})
+
+    first = provider_isolated.format_tools_for_provider([echo, noop])
+
+    # A new list holding the same tools hits the cache
+    assert provider_isolated.format_tools_for_provider([echo, noop]) is first
+    assert provider_isolated.format_tools_for_provider([noop, echo]) is not first
+
+
+@pytest.mark.parametrize(
+    "arguments,expected",
+    [
+        (
+            CALCULATOR_ARGS_JSON,
+            CALCULATOR_ARGS,
+        ),
+        ("{invalid_json}", {"error": "Invalid JSON in arguments"}),
+    ],
+    ids=["valid_json", "invalid_json"],
+)
+def test_parse_tool_calls(provider, make_response, make_tool_call, arguments, expected):
+    """Test parsing tool calls from a chat completions response."""
+    mock_response = make_response(
+        tool_calls=[make_tool_call("calculator", arguments, "call_123")]
+    )
+
+    tool_calls = provider.parse_tool_calls(mock_response)
+
+    assert len(tool_calls) == 1
+    assert tool_calls[0].tool_name == "calculator"
+    assert tool_calls[0].call_id == "call_123"
+    assert tool_calls[0].arguments == expected
+
+
+def _api_error(error_class, status_code):
+    """Build an OpenAI SDK status error for a response with the given status."""
+    request = httpx.Request("POST", "https://test-endpoint/chat/completions")
+    return error_class(
+        "API Error",
+        response=httpx.Response(status_code, request=request),
+        body=None,
+    )
+
+
+class GenerateCase(NamedTuple):
+    """
+    A canned outcome of the chat completions request and what to expect of it.
+
+    Set error to make the request raise, in which case message is part of the
+    error raised by _generate_sync. Otherwise the response holds content, and
+    a calculator tool call with tool_call_args when those are set.
+    """
+
+    prompt: str = "Hello"
+    with_tools: bool = False
+    content: Optional[str] = None
+    tool_call_args: Optional[str] = None
+    error: Optional[BaseException] = None
+    message: Optional[str] = None
+
+
+_GENERATE_CASES = {
+    "success": GenerateCase(
+        prompt="Hello, how are you?", content="Hello, I'm an AI assistant."
+    ),
+    "with_tools": GenerateCase(
+        prompt="Calculate 5 + 3",
+        with_tools=True,
+        tool_call_args=CALCULATOR_ARGS_JSON,
+    ),
+    "generic_error": GenerateCase(
+        error=Exception("API Error"), message="API request failed: API Error"
+    ),
+    "timeout": GenerateCase(
+        error=TimeoutError("API Error"), message="API request timed out"
+    ),
+    "sdk_timeout": GenerateCase(
+        error=APITimeoutError(request=httpx.Request("POST", "https://test")),
+        message="API request timed out",
+    ),
+    "connection": GenerateCase(
+        error=ConnectionError("API Error"),
+        message="API request failed (connection error)",
+    ),
+    "sdk_connection": GenerateCase(
+        error=APIConnectionError(request=httpx.Request("POST", "https://test")),
+        message="API request failed (connection error)",
+    ),
+    "rate_limit": GenerateCase(
+        error=_api_error(RateLimitError, 429),
+        message="API request failed (rate limited)",
+    ),
+    "authentication": GenerateCase(
+        error=_api_error(AuthenticationError, 401),
+        message="API request failed (authentication error)",
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "case", list(_GENERATE_CASES.values()), ids=list(_GENERATE_CASES)
+)
+def test_generate_sync(
+    case,
+    provider_isolated,
+    provider_spec,
+    calculator_tool,
+    make_response,
+    make_tool_call,
+):
+    """Test synchronous generation for each outcome of the request."""
+    mock_create = provider_isolated.client.chat.completions.create
+    tools = [calculator_tool] if case.with_tools else None
+
+    if case.error is not None:
+        mock_create.side_effect = case.error
+
+        with pytest.raises(provider_spec.error, match=r"OpenAI API request") as excinfo:
+            provider_isolated._generate_sync(case.prompt, tools)
+
+        assert case.message in str(excinfo.value)
+        assert excinfo.value.__cause__ is case.error
+        return
+
+    tool_calls = []
+    if case.tool_call_args is not None:
+        tool_calls.append(make_tool_call("calculator", case.tool_call_args, "call_123"))
+    mock_create.return_value = make_response(case.content, tool_calls)
+
+    response = provider_isolated._generate_sync(case.prompt, tools)
+
+    # Verify the response
+    assert response.content == case.content
+    assert [(c.tool_name, c.arguments) for c in response.tool_calls] == [
+        ("calculator", CALCULATOR_ARGS) for _ in tool_calls
+    ]
+
+    # Verify the request
+    assert mock_create.calls == 1
+    kwargs = mock_create.kwargs
+    assert kwargs["model"] == provider_spec.model
+    assert kwargs["messages"][0]["content"] == case.prompt
+    assert [tool["function"]["name"] for tool in kwargs.get("tools", [])] == [
+        tool.name for tool in tools or []
+    ]
+
+
+@pytest.mark.parametrize("arguments", ["", "not json", "{", "}"])
+def test_parse_tool_calls_rejects_malformed_without_parsing(
+    provider, make_response, make_tool_call, monkeypatch, arguments
+):
+    """Test that arguments that can't be a JSON object are never parsed."""
+    loads_calls = []
+    loads = serialization.loads
+    monkeypatch.setattr(
+        serialization, "loads", lambda data: loads_calls.append(data) or loads(data)
+    )
+
+    tool_calls = provider.parse_tool_calls(
+        make_response(tool_calls=[make_tool_call("calculator", arguments, "call_1")])
+    )
+
+    assert tool_calls[0].arguments == {"error": "Invalid JSON in arguments"}
+    assert loads_calls == []
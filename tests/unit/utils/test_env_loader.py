@@ -0,0 +1,118 @@
+"""
+Unit tests for the environment loader utility.
+"""
+
+import os
+
+import pytest
+
+from llm_toolbridge.utils import env_loader
+from llm_toolbridge.utils.env_loader import load_dotenv, get_env_var
+
+
+@pytest.fixture(autouse=True)
+def isolated_environ(monkeypatch):
+    # Keep variables loaded by the tests out of the real environment, and
+    # start every test without cached .env files
+    monkeypatch.setattr(os, "environ", dict(os.environ))
+    monkeypatch.setattr(env_loader, "_DOTENV_CACHE", {})
+    monkeypatch.setattr(env_loader, "_DISCOVERED_PATHS", {})
+
+
+def test_load_dotenv_expected_use(tmp_path):
+    """Test loading bare, quoted and commented values."""
+    dotenv = tmp_path / ".env"
+    dotenv.write_text(
+        "# Azure settings\n"
+        "\n"
+        "AZURE_OPENAI_API_KEY=secret-key\n"
+        'AZURE_OPENAI_ENDPOINT="https://example.openai.azure.com"\n'
+        "AZURE_OPENAI_DEPLOYMENT = 'gpt-4' \n"
+        "AZURE_OPENAI_API_VERSION=2024-02-01  # pinned\n"
+    )
+
+    loaded = load_dotenv(str(dotenv))
+
+    assert loaded == {
+        "AZURE_OPENAI_API_KEY": "secret-key",
+        "AZURE_OPENAI_ENDPOINT": "https://example.openai.azure.com",
+        "AZURE_OPENAI_DEPLOYMENT": "gpt-4",
+        "AZURE_OPENAI_API_VERSION": "2024-02-01",
+    }
+    assert get_env_var("AZURE_OPENAI_DEPLOYMENT") == "gpt-4"
+
+
+def test_load_dotenv_edge_cases(tmp_path):
+    """Test empty values, '#' inside values and lines that aren't assignments."""
+    dotenv = tmp_path / ".env"
+    dotenv.write_text(
+        "EMPTY=\n"
+        'EMPTY_QUOTED=""\n'
+        "PASSWORD=abc#def\n"
+        'QUOTED_HASH="a # b"\n'
+        "EQUALS=a=b\n"
+        "not an assignment\n"
+        "=missing-key\n"
+    )
+
+    loaded = load_dotenv(str(dotenv))
+
+    assert loaded == {
+        "EMPTY": "",
+        "EMPTY_QUOTED": "",
+        "PASSWORD": "abc#def",
+        "QUOTED_HASH": "a # b",
+        "EQUALS": "a=b",
+    }
+
+
+def test_load_dotenv_uses_cache(tmp_path, monkeypatch):
+    """Test that repeated loads reuse the discovered path and parsed values."""
+    (tmp_path / ".env").write_text("CACHED_KEY=first\n")
+    monkeypatch.chdir(tmp_path)
+
+    parse_calls = []
+    real_parse = env_loader._parse_dotenv
+    monkeypatch.setattr(
+        env_loader,
+        "_parse_dotenv",
+        lambda path: parse_calls.append(path) or real_parse(path),
+    )
+
+    assert load_dotenv() == {"CACHED_KEY": "first"}
+
+    # Values changed in the environment are set again from the cache
+    os.environ["CACHED_KEY"] = "changed"
+    assert load_dotenv() == {"CACHED_KEY": "first"}
+    assert os.environ["CACHED_KEY"] == "first"
+
+    assert parse_calls == [str((tmp_path / ".env").resolve())]
+
+
+def test_load_dotenv_relative_path_from_two_directories(tmp_path, monkeypatch):
+    """Test that the same relative path loads each directory's own file."""
+    for name in ("envA", "envB"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / ".env").write_text(f"WHICH_ENV={name}\n")
+
+    monkeypatch.chdir(tmp_path / "envA")
+    assert load_dotenv(".env") == {"WHICH_ENV": "envA"}
+
+    monkeypatch.chdir(tmp_path / "envB")
+    assert load_dotenv(".env") == {"WHICH_ENV": "envB"}
+    assert os.environ["WHICH_ENV"] == "envB"
+
+
+def test_load_dotenv_rereads_edited_file(tmp_path):
+    """Test that a .env file edited after it was loaded is parsed again."""
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("EDITED_KEY=old\n")
+    assert load_dotenv(str(dotenv)) == {"EDITED_KEY": "old"}
+
+    dotenv.write_text("EDITED_KEY=newer\n")
+    assert load_dotenv(str(dotenv)) == {"EDITED_KEY": "newer"}
+
+
+def test_load_dotenv_missing_file(tmp_path):
+    """Test that a missing .env file loads nothing (failure case)."""
+    assert load_dotenv(str(tmp_path / "missing.env")) == {}
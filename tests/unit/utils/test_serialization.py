@@ -0,0 +1,144 @@
+"""
+Unit tests for the serialization utility.
+"""
+
+import datetime
+import json
+import math
+from dataclasses import dataclass
+
+import pytest
+
+from llm_toolbridge.utils import serialization
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    # Run each test with orjson (when installed) and with the stdlib fallback
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+def test_round_trip(backend):
+    """Test that dumps and loads round-trip nested structures."""
+    data = {"result": [1, 2.5, "three", None, True], "nested": {"a": {"b": []}}}
+    assert serialization.loads(serialization.dumps(data)) == data
+
+
+def test_dumps_non_string_keys(backend):
+    """Test that non-string keys are converted like the json module does."""
+    assert json.loads(serialization.dumps({1: "one"})) == {"1": "one"}
+
+
+def test_dumps_big_integer(backend):
+    """Test integers wider than 64 bits fall back to the json module (edge case)."""
+    assert serialization.dumps({"n": 2**70}) == '{"n":%d}' % 2**70
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ({"a": [1, 2.5], "b": None}, '{"a":[1,2.5],"b":null}'),
+        ({"city": "Zürich"}, '{"city":"Zürich"}'),
+        ({"x": float("nan"), "y": [float("inf")]}, '{"x":NaN,"y":[Infinity]}'),
+        ({"x": None, "y": (1.0, -float("inf"))}, '{"x":null,"y":[1.0,-Infinity]}'),
+    ],
+)
+def test_dumps_same_output_with_both_backends(backend, data, expected):
+    """Test that both backends write the same compact JSON, NaN included."""
+    assert serialization.dumps(data) == expected
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize(
+    "value",
+    [datetime.datetime(2024, 1, 1), datetime.date(2024, 1, 1), _Point(1, 2)],
+    ids=["datetime", "date", "dataclass"],
+)
+def test_dumps_rejects_what_json_rejects(backend, value):
+    """Test that orjson doesn't serialize values the json module rejects."""
+    with pytest.raises(TypeError):
+        serialization.dumps({"value": value})
+
+
+def _numbers(value):
+    """Yield the numbers of a parsed JSON document."""
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        for item in value:
+            yield from _numbers(item)
+    elif isinstance(value, (int, float)):
+        yield value
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        (
+            '{"n": 123456789012345678901234567890}',
+            {"n": 123456789012345678901234567890},
+        ),
+        ("[-9223372036854775809, 18446744073709551616]", [-(2**63) - 1, 2**64]),
+        (
+            b'{"n": 123456789012345678901234567890}',
+            {"n": 123456789012345678901234567890},
+        ),
+        (
+            '{"id": "12345678901234567890", "n": 1}',
+            {"id": "12345678901234567890", "n": 1},
+        ),
+    ],
+)
+def test_loads_wide_integers(backend, data, expected):
+    """Test that integers wider than 64 bits keep their exact value (edge case)."""
+    loaded = serialization.loads(data)
+    assert loaded == expected
+    assert all(type(value) is int for value in _numbers(loaded))
+
+
+def test_loads_non_finite_numbers(backend):
+    """Test that NaN and infinities are parsed like the json module does."""
+    loaded = serialization.loads('{"x": NaN, "y": [Infinity, -Infinity], "z": 1e400}')
+
+    assert math.isnan(loaded["x"])
+    assert loaded["y"] == [math.inf, -math.inf]
+    assert loaded["z"] == math.inf
+
+
+def test_loads_invalid_json(backend):
+    """Test that invalid JSON raises json.JSONDecodeError (failure case)."""
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads("{invalid_json}")
+
+
+def test_dumps_unserializable(backend):
+    """Test that unserializable objects raise TypeError (failure case)."""
+    with pytest.raises(TypeError):
+        serialization.dumps({"value": object()})
+
+
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        ('{"x": 1}', True),
+        ('  {"x": 1}\n', True),
+        ("{invalid_json}", True),
+        ("", False),
+        ("not json", False),
+        ("[1, 2]", False),
+        ("{", False),
+    ],
+)
+def test_looks_like_object(data, expected):
+    """Test the cheap JSON object check, which only looks at the delimiters."""
+    assert serialization.looks_like_object(data) is expected
@@ -0,0 +1,41 @@
+"""
+Unit tests for the tool formatting utility.
+"""
+
+import weakref
+from collections import OrderedDict
+
+from llm_toolbridge.core.tool import Tool
+from llm_toolbridge.utils import tool_format
+from llm_toolbridge.utils.tool_format import ToolFormatter
+
+
+def test_format_expected_use(calculator_tool):
+    """Test that a tool is wrapped as a function definition."""
+    formatted = ToolFormatter().format([calculator_tool])
+
+    assert formatted == [{"type": "function", "function": calculator_tool.to_dict()}]
+
+
+def test_format_registers_no_finalizers(calculator_tool):
+    """Test that short-lived formatters don't leave state behind on a Tool."""
+    live_finalizers = len(weakref.finalize._registry)
+
+    for _ in range(100):
+        ToolFormatter().format([calculator_tool])
+
+    assert len(weakref.finalize._registry) == live_finalizers
+
+
+def test_format_cache_is_bounded(monkeypatch):
+    """Test that the least recently used definitions are evicted (edge case)."""
+    monkeypatch.setattr(tool_format, "_TOOL_CACHE", OrderedDict())
+    monkeypatch.setattr(tool_format, "_TOOL_CACHE_SIZE", 2)
+    formatter = ToolFormatter()
+
+    for name in ("one", "two", "three"):
+        formatter.format([Tool(name=name, description="Does nothing", parameters={})])
+
+    assert [
+        entry["function"]["name"] for entry in tool_format._TOOL_CACHE.values()
+    ] == ["two", "three"]